@@ -6,59 +6,154 @@ FastAPI dependency injection for pipeline, job manager, and authentication.
 Implemented in Phase 2.
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError
+from jwt import PyJWTError
 
-from config import get_settings
-from core.pipeline import MedicalDocumentationPipeline
+from api.state import app_state
+from api.utils.file_handler import FileHandler
+from api.utils.security import verify_token_cached
+
+if TYPE_CHECKING:
+    # Type-only import: core.pipeline pulls in Whisper/LangChain
+    from core.pipeline import MedicalDocumentationPipeline
 
 # Security scheme for JWT Bearer tokens
 security = HTTPBearer(auto_error=False)
 
+# Prebuilt 401 responses - exceptions are safely re-raisable, so failed
+# auth attempts don't allocate a new exception and headers dict each time
+_AUTH_REQUIRED = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Authentication required",
+    headers={"WWW-Authenticate": "Bearer"}
+)
+_INVALID_CREDENTIALS = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"}
+)
+
+
+# Module-level bindings, populated on first successful lookup. The pipeline
+# and job manager are fixed for the lifetime of the app, so we skip the
+# app_state lookup after the first request. Reset on shutdown.
+_PIPELINE: Optional["MedicalDocumentationPipeline"] = None
+_JOB_MANAGER = None
+
 
-def get_pipeline() -> MedicalDocumentationPipeline:
+def reset_dependency_cache() -> None:
+    """
+    Clear the cached pipeline and job manager bindings.
+    
+    Called from the lifespan shutdown hook alongside app_state.clear().
+    """
+    global _PIPELINE, _JOB_MANAGER
+    _PIPELINE = None
+    _JOB_MANAGER = None
+
+
+def get_pipeline() -> "MedicalDocumentationPipeline":
     """
     Dependency to get the pipeline instance from app state.
     
-    The pipeline is pre-loaded during application startup (lifespan)
-    to avoid model loading delays on first request.
+    The pipeline is pre-loaded in the background during application
+    startup (lifespan) to avoid model loading delays on first request.
     
     Returns:
         MedicalDocumentationPipeline: The configured pipeline instance
         
     Raises:
-        HTTPException: If pipeline is not initialized
+        HTTPException: If pipeline is not initialized or still loading
     """
-    from api.main import app_state
-    
-    pipeline = app_state.get("pipeline")
-    if pipeline is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Pipeline not initialized. Service is starting up."
-        )
-    return pipeline
+    global _PIPELINE
+    if _PIPELINE is None:
+        pipeline = app_state.get("pipeline")
+        if pipeline is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Pipeline not initialized. Service is starting up."
+            )
+        _PIPELINE = pipeline
+    return _PIPELINE
 
 
 def get_job_manager():
     """
     Dependency to get job manager instance.
     
-    Creates a singleton JobManager if not already in app state.
+    The JobManager singleton is created once during application startup
+    (lifespan), so concurrent first requests never race to build
+    duplicate Redis connections.
     JobManager handles Redis-based job queue operations.
     
     Returns:
         JobManager: The job manager instance
+        
+    Raises:
+        HTTPException: If job manager is not initialized
+    """
+    global _JOB_MANAGER
+    if _JOB_MANAGER is None:
+        job_manager = app_state.get("job_manager")
+        if job_manager is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Job manager not initialized. Service is starting up."
+            )
+        _JOB_MANAGER = job_manager
+    return _JOB_MANAGER
+
+
+@lru_cache(maxsize=1)
+def get_file_handler() -> FileHandler:
+    """
+    Dependency to get the shared FileHandler instance.
+    
+    FileHandler only holds settings-derived configuration, so one
+    instance is reused across all upload requests.
+    
+    Returns:
+        FileHandler: The file handler instance
+    """
+    return FileHandler()
+
+
+def _verify_credentials(
+    credentials: Optional[HTTPAuthorizationCredentials]
+) -> Optional[dict]:
     """
-    from api.main import app_state
-    from api.services.job_manager import JobManager
+    Resolve Bearer credentials to user information without raising.
+    
+    Shared by the required and optional auth dependencies so the anonymous
+    path never pays for raising and catching an HTTPException.
+    
+    Args:
+        credentials: Optional HTTP Authorization header with Bearer token
+        
+    Returns:
+        dict: User information with 'user_id' and 'email', or None if the
+        token is missing or invalid
+    """
+    if credentials is None:
+        return None
+    
+    try:
+        payload = verify_token_cached(credentials.credentials)
+    except PyJWTError:
+        return None
     
-    if "job_manager" not in app_state:
-        app_state["job_manager"] = JobManager()
-    return app_state["job_manager"]
+    user_id = payload.get("sub")
+    if user_id is None:
+        return None
+    
+    return {
+        "user_id": user_id,
+        "email": payload.get("email")
+    }
 
 
 async def get_current_user(
@@ -80,36 +175,13 @@ async def get_current_user(
         HTTPException: 401 if token is missing or invalid
     """
     if credentials is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
+        raise _AUTH_REQUIRED
     
-    token = credentials.credentials
+    user = _verify_credentials(credentials)
+    if user is None:
+        raise _INVALID_CREDENTIALS
     
-    try:
-        from api.utils.security import verify_token
-        payload = verify_token(token)
-        user_id = payload.get("sub")
-        
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"}
-            )
-        
-        return {
-            "user_id": user_id,
-            "email": payload.get("email")
-        }
-    except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
+    return user
 
 
 async def get_current_user_optional(
@@ -127,10 +199,4 @@ async def get_current_user_optional(
     Returns:
         dict: User information if authenticated, None otherwise
     """
-    if credentials is None:
-        return None
-    
-    try:
-        return await get_current_user(credentials)
-    except HTTPException:
-        return None
+    return _verify_credentials(credentials)
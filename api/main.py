@@ -6,22 +6,80 @@ Main FastAPI application instance with middleware, routes, and lifespan manageme
 Implemented in Phase 2.
 """
 
+import asyncio
+import logging
+import queue
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Tuple
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
+from api.dependencies import reset_dependency_cache
 from api.middleware.error_handler import error_handler_middleware
-from api.middleware.rate_limiter import setup_rate_limiting
+from api.middleware.health_interceptor import HealthCheckInterceptor
+from api.middleware.rate_limiter import setup_rate_limiting, close_rate_limiter
 from api.routes import health, jobs, auth, websocket
-from config import get_settings
-from core.pipeline import create_pipeline
+from api.services.job_manager import JobManager
+from api.state import app_state
+from config import Settings, get_settings
 
 
-# Global application state - stores pipeline and other singletons
-app_state: Dict[str, Any] = {}
+# Set up module logger
+logger = logging.getLogger(__name__)
+
+
+def _start_log_listener(settings: Settings) -> Tuple[QueueHandler, QueueListener]:
+    """
+    Route root logging through an in-memory queue.
+    
+    Log calls on the event loop only enqueue the record; a background
+    listener thread does the formatting and stream I/O, so a slow stdout
+    pipe can never stall request handling.
+    
+    Args:
+        settings: Application settings (log_level, log_format)
+        
+    Returns:
+        The installed QueueHandler and the running QueueListener
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(settings.log_format))
+    
+    queue_handler = QueueHandler(log_queue)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(settings.log_level.upper())
+    
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return queue_handler, listener
+
+
+async def _load_pipeline(settings: Settings) -> None:
+    """
+    Build the pipeline in a worker thread and publish it to app_state.
+    
+    Runs as a background task so model loading never blocks the event loop;
+    until it finishes, get_pipeline() answers 503.
+    
+    Args:
+        settings: Application settings
+    """
+    try:
+        # Imported here so the ML stack loads in the worker thread, not at fork
+        from core.pipeline import create_pipeline
+        pipeline = await asyncio.to_thread(create_pipeline, settings)
+        app_state["pipeline"] = pipeline
+        logger.info("Pipeline loaded successfully")
+    except Exception as e:
+        # Leave None - health check will report unhealthy
+        logger.error("Failed to initialize pipeline: %s", e)
 
 
 @asynccontextmanager
@@ -30,7 +88,9 @@ async def lifespan(app: FastAPI):
     Lifespan event handler for startup and shutdown.
     
     Startup:
-    - Pre-loads the ML pipeline and models to avoid first-request delays
+    - Pre-loads the ML pipeline and models in a background thread to avoid
+      first-request delays without blocking the event loop
+    - Creates the JobManager singleton (one Redis connection per worker)
     - Stores references in app_state for dependency injection
     
     Shutdown:
@@ -40,34 +100,44 @@ async def lifespan(app: FastAPI):
     on each request, significantly improving response times.
     """
     settings = get_settings()
+    queue_handler, log_listener = _start_log_listener(settings)
     
     # Startup: Pre-load pipeline and models
-    print("🚀 Starting MedScribe AI API...")
-    print(f"   Loading Whisper model: {settings.whisper_model}")
-    print(f"   Ollama model: {settings.ollama_model}")
+    logger.info("Starting MedScribe AI API...")
+    logger.info("Loading Whisper model: %s", settings.whisper_model)
+    logger.info("Ollama model: %s", settings.ollama_model)
     
-    try:
-        # Create and store pipeline instance
-        pipeline = create_pipeline(settings)
-        app_state["pipeline"] = pipeline
-        app_state["settings"] = settings
-        
-        print("✅ Pipeline loaded successfully")
-        print(f"📍 API running at http://{settings.api_host}:{settings.api_port}")
-        print(f"📚 Docs available at http://{settings.api_host}:{settings.api_port}/api/docs")
-        
-    except Exception as e:
-        print(f"❌ Failed to initialize pipeline: {e}")
-        # Store None - health check will report unhealthy
-        app_state["pipeline"] = None
-        app_state["settings"] = settings
+    # Load the pipeline in the background so the server starts accepting
+    # connections (and probes get a fast 503) while models are loading
+    app_state["pipeline"] = None
+    app_state["settings"] = settings
+    app_state["pipeline_task"] = asyncio.create_task(_load_pipeline(settings))
+    
+    logger.info("API running at http://%s:%s", settings.api_host, settings.api_port)
+    logger.info("Docs available at http://%s:%s/api/docs", settings.api_host, settings.api_port)
+    
+    # Create the job manager once, before any request can race to build it
+    app_state["job_manager"] = JobManager()
     
     yield  # Application runs here
     
     # Shutdown: Cleanup
-    print("\n🛑 Shutting down MedScribe AI API...")
+    logger.info("Shutting down MedScribe AI API...")
+    pipeline_task = app_state.get("pipeline_task")
+    if pipeline_task is not None and not pipeline_task.done():
+        pipeline_task.cancel()
+    await close_rate_limiter()
+    from api.routes.health import close_health_clients
+    from api.routes.websocket import close_redis_pool
+    await close_health_clients()
+    await close_redis_pool()
     app_state.clear()
-    print("✅ Cleanup complete")
+    reset_dependency_cache()
+    logger.info("Cleanup complete")
+    
+    # Flush queued records and detach the queue handler
+    logging.getLogger().removeHandler(queue_handler)
+    log_listener.stop()
 
 
 # Create FastAPI application
@@ -89,6 +159,7 @@ app = FastAPI(
     """,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json"
@@ -96,7 +167,7 @@ app = FastAPI(
 
 
 # =============================================================================
-# Middleware Setup (order matters - first added = outermost)
+# Middleware Setup (order matters - last added = outermost)
 # =============================================================================
 
 # Get settings for middleware configuration
@@ -121,13 +192,20 @@ app.add_middleware(
 # Global error handling middleware
 app.middleware("http")(error_handler_middleware)
 
-# Rate limiting setup
+# Rate limiting - 429 handler for routes using the rate_limit dependency
 setup_rate_limiting(app)
 
+# Liveness short-circuit - added last so it wraps everything above and
+# answers /api/v1/health/live before any other middleware runs
+app.add_middleware(HealthCheckInterceptor)
+
 
 # =============================================================================
 # Router Registration
 # =============================================================================
+# The route modules only reference the pipeline for type hints and import
+# tasks (and with it the ML stack) on first use, so registering them at
+# import keeps Whisper, LangChain and torch out of the pre-fork import.
 
 # Health check endpoints (no auth required)
 app.include_router(
@@ -2,36 +2,20 @@
 Global Error Handler Middleware
 ================================
 
-Maps custom exceptions to HTTP status codes and formats error responses.
+Converts custom exceptions to HTTP responses using each exception's
+``http_status`` class attribute.
 Implemented in Phase 2.
 """
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from exceptions import (
-    MedScribeError,
-    AudioFileNotFoundError,
-    UnsupportedAudioFormatError,
-    AudioTooLongError,
-    OllamaConnectionError,
-    ConfigurationError,
-    TranscriptionError,
-    GenerationError,
-)
+from exceptions import MedScribeError
 from config import get_settings
 
 
-# Map exceptions to HTTP status codes
-EXCEPTION_STATUS_MAP = {
-    AudioFileNotFoundError: status.HTTP_404_NOT_FOUND,
-    UnsupportedAudioFormatError: status.HTTP_400_BAD_REQUEST,
-    AudioTooLongError: status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-    OllamaConnectionError: status.HTTP_503_SERVICE_UNAVAILABLE,
-    ConfigurationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-    TranscriptionError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-    GenerationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-}
+# Settings are snapshotted at import; changing api_debug requires a restart.
+_DEBUG = get_settings().api_debug
 
 
 async def error_handler_middleware(request: Request, call_next):
@@ -46,29 +30,24 @@ async def error_handler_middleware(request: Request, call_next):
         call_next: The next middleware/route handler
         
     Returns:
-        Response or JSONResponse with error details
+        Response or ORJSONResponse with error details
     """
     try:
         response = await call_next(request)
         return response
     except MedScribeError as e:
-        # Use existing to_dict() method from our exception hierarchy
-        status_code = EXCEPTION_STATUS_MAP.get(
-            type(e), 
-            status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-        return JSONResponse(
-            status_code=status_code,
+        # Status code is declared on the exception class (inherited by subclasses)
+        return ORJSONResponse(
+            status_code=e.http_status,
             content=e.to_dict()
         )
     except Exception as e:
         # Unexpected errors - hide details in production
-        settings = get_settings()
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error_type": "InternalServerError",
                 "message": "An unexpected error occurred",
-                "details": {"error": str(e)} if settings.api_debug else {}
+                "details": {"error": str(e)} if _DEBUG else {}
             }
         )
@@ -1,45 +1,180 @@
 """
-Rate Limiting Middleware
-========================
+Rate Limiting
+=============
 
-Rate limiting setup using slowapi.
+Fixed-window, per-client rate limiting backed by Redis.
 Implemented in Phase 2 (basic setup), enhanced in Phase 8.
+
+Limits apply only to the routes that declare the ``rate_limit``
+dependency (job submission), each with its own bucket. Clients are keyed
+by user ID when authenticated, otherwise by remote address, so users
+behind a shared proxy IP don't share one bucket once they log in.
+
+Each check costs a single Redis round trip: an atomic Lua script
+increments the client's counter for the current window and sets its
+expiry on first hit. Counters live in Redis, so limits hold across all
+uvicorn workers and API replicas.
 """
 
-from fastapi import FastAPI, Request
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+import logging
+import time
+from typing import Optional
+
+import redis.asyncio as aioredis
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import ORJSONResponse
 
+from api.dependencies import get_current_user_optional
 from config import get_settings
+from exceptions import RateLimitExceededError
+
+
+# Set up module logger
+logger = logging.getLogger(__name__)
+
+# Window length in seconds (limits are configured per minute)
+RATE_LIMIT_WINDOW_SECONDS = 60
+
+# After a Redis failure, skip limiting for this long instead of waiting
+# out the connect timeout on every request
+RATE_LIMIT_REDIS_BACKOFF_SECONDS = 30.0
+
+# INCR the window counter, set its TTL on first hit, return count and TTL
+_RATE_LIMIT_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return {count, redis.call('TTL', KEYS[1])}
+"""
+
+_redis_client: Optional[aioredis.Redis] = None
+_rate_limit_script = None
+
+# time.monotonic() before which Redis is assumed to still be down
+_redis_retry_at = 0.0
+
+
+def _get_rate_limit_script():
+    """
+    Lazily create the Redis client and register the Lua script.
+
+    register_script() calls EVALSHA and transparently falls back to
+    loading the script if Redis doesn't have it cached yet.
+    """
+    global _redis_client, _rate_limit_script
+    if _rate_limit_script is None:
+        settings = get_settings()
+        _redis_client = aioredis.Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            password=settings.redis_password or None,
+            socket_connect_timeout=1.0,
+            socket_timeout=1.0
+        )
+        _rate_limit_script = _redis_client.register_script(_RATE_LIMIT_SCRIPT)
+    return _rate_limit_script
+
+
+async def close_rate_limiter() -> None:
+    """Close the rate limiter's Redis connection (called on shutdown)."""
+    global _redis_client, _rate_limit_script
+    if _redis_client is not None:
+        try:
+            await _redis_client.close()
+        except Exception:
+            pass  # Best effort cleanup
+    _redis_client = None
+    _rate_limit_script = None
+
+
+async def rate_limit(
+    request: Request,
+    user: Optional[dict] = Depends(get_current_user_optional)
+) -> None:
+    """
+    Route dependency rejecting clients over their per-minute limit.
+
+    Authenticated users get rate_limit_authenticated per user, anonymous
+    clients rate_limit_per_minute per remote address. Each route has
+    its own bucket. If Redis is unavailable the request is allowed
+    through (fail open), and Redis is not retried for
+    RATE_LIMIT_REDIS_BACKOFF_SECONDS.
+
+    Usage:
+        @router.post("/process", dependencies=[Depends(rate_limit)])
+
+    Args:
+        request: The incoming request
+        user: Optional authenticated user
+
+    Raises:
+        RateLimitExceededError: If the client is over its limit
+    """
+    global _redis_retry_at
+
+    # CORS preflights never count against the limit
+    if request.method == "OPTIONS":
+        return
+
+    if time.monotonic() < _redis_retry_at:
+        return
+
+    settings = get_settings()
+    route = request.scope.get("route")
+    path_prefix = route.path if route is not None else request.url.path
+
+    if user is not None:
+        limit = settings.rate_limit_authenticated
+        key = f"ratelimit:user:{user['user_id']}:{path_prefix}"
+    else:
+        limit = settings.rate_limit_per_minute
+        client_host = request.client.host if request.client else "unknown"
+        key = f"ratelimit:{client_host}:{path_prefix}"
+
+    try:
+        script = _get_rate_limit_script()
+        count, ttl = await script(keys=[key], args=[RATE_LIMIT_WINDOW_SECONDS])
+    except Exception as e:
+        _redis_retry_at = time.monotonic() + RATE_LIMIT_REDIS_BACKOFF_SECONDS
+        logger.warning(
+            "Rate limiter unavailable, allowing requests for %gs: %s",
+            RATE_LIMIT_REDIS_BACKOFF_SECONDS, e
+        )
+        return
+
+    if count > limit:
+        retry_after = ttl if ttl > 0 else RATE_LIMIT_WINDOW_SECONDS
+        raise RateLimitExceededError(limit=limit, retry_after=retry_after)
+
 
+async def rate_limit_exceeded_handler(
+    request: Request,
+    exc: RateLimitExceededError
+) -> ORJSONResponse:
+    """
+    Convert RateLimitExceededError to a 429 with a Retry-After header.
 
-# Create limiter instance with IP-based rate limiting
-limiter = Limiter(key_func=get_remote_address)
+    Registered as an exception handler rather than left to the error
+    handler middleware, so the response is built inside CORSMiddleware
+    and browsers can read it.
+    """
+    return ORJSONResponse(
+        status_code=exc.http_status,
+        content=exc.to_dict(),
+        headers={"Retry-After": str(exc.retry_after)}
+    )
 
 
 def setup_rate_limiting(app: FastAPI) -> None:
     """
     Set up rate limiting for the FastAPI application.
-    
-    Attaches the limiter to the app state and registers
-    the exception handler for rate limit exceeded errors.
-    
+
+    Registers the 429 handler. Routes opt in to limiting with the
+    rate_limit dependency.
+
     Args:
         app: The FastAPI application instance
-        
-    Usage in routes:
-        from api.middleware.rate_limiter import limiter
-        
-        @router.post("/process")
-        @limiter.limit("10/minute")
-        async def submit_job(request: Request, ...):
-            ...
     """
-    settings = get_settings()
-    
-    # Attach limiter to app state for access in routes
-    app.state.limiter = limiter
-    
-    # Register exception handler for rate limit exceeded
-    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    app.add_exception_handler(RateLimitExceededError, rate_limit_exceeded_handler)
@@ -5,8 +5,8 @@ API Response Models
 Pydantic models for API responses.
 """
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional, Any
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, Any, Dict
 from datetime import datetime
 from enum import Enum
 
@@ -51,14 +51,6 @@ class JobResponse(BaseModel):
         description="Timestamp when the job was created"
     )
 
-    @field_validator('created_at', mode='before')
-    @classmethod
-    def parse_datetime(cls, v):
-        """Parse datetime from ISO format string if needed."""
-        if isinstance(v, str):
-            return datetime.fromisoformat(v)
-        return v
-
 
 class JobStatusResponse(BaseModel):
     """Response model for job status check endpoints."""
@@ -101,6 +93,10 @@ class JobStatusResponse(BaseModel):
         default=None,
         description="Job result (available when status is 'completed')"
     )
+    partial_result: Optional[Dict[str, str]] = Field(
+        default=None,
+        description="SOAP sections generated so far (while a SOAP generation job is processing)"
+    )
     error: Optional[dict] = Field(
         default=None,
         description="Error details (available when status is 'failed')"
@@ -113,11 +109,3 @@ class JobStatusResponse(BaseModel):
         ...,
         description="Timestamp when the job was last updated"
     )
-
-    @field_validator('created_at', 'updated_at', mode='before')
-    @classmethod
-    def parse_datetime(cls, v):
-        """Parse datetime from ISO format string if needed."""
-        if isinstance(v, str):
-            return datetime.fromisoformat(v)
-        return v
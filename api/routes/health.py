@@ -6,26 +6,135 @@ API health check endpoints for monitoring and Kubernetes probes.
 Implemented in Phase 3.
 """
 
+import asyncio
 import logging
+import time
+from functools import lru_cache
+
+import httpx
+import orjson
 import psutil
-from datetime import datetime
-from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Callable, Awaitable, TYPE_CHECKING
 from enum import Enum
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from config import Settings, get_settings
 from api.dependencies import get_pipeline, get_job_manager
-from core.pipeline import MedicalDocumentationPipeline
 from api.services.job_manager import JobManager
 
+if TYPE_CHECKING:
+    # Type-only import: core.pipeline pulls in Whisper/LangChain
+    from core.pipeline import MedicalDocumentationPipeline
+
 
 # Set up module logger
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# How long a computed health/readiness result is reused. Probes arriving
+# within this window share one set of downstream checks.
+HEALTH_CACHE_TTL_SECONDS = 5.0
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string, e.g. '2024-01-17T10:30:00Z'."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class _TTLCachedResult:
+    """
+    Single-value async cache with a TTL and single-flight refresh.
+
+    When the cached value expires, the first caller recomputes it while
+    concurrent callers wait on the lock and then reuse the new value, so a
+    burst of probes triggers at most one round of downstream checks.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._value: Any = None
+        self._timestamp = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return self._value is not None and time.monotonic() - self._timestamp < self.ttl_seconds
+
+    async def get(self, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value, recomputing it with `compute` if expired."""
+        if self._is_fresh():
+            return self._value
+
+        async with self._lock:
+            if not self._is_fresh():
+                self._value = await compute()
+                self._timestamp = time.monotonic()
+            return self._value
+
+    def invalidate(self) -> None:
+        """Force the next get() to recompute."""
+        self._value = None
+
+
+_health_cache = _TTLCachedResult(HEALTH_CACHE_TTL_SECONDS)
+
+# Prime psutil's CPU counter so get_system_metrics() can read a
+# non-blocking delta instead of sleeping for a sample interval
+psutil.cpu_percent(interval=None)
+
+# Timeout for the LLM backend availability check (Ollama's /api/tags or
+# vLLM's /health)
+LLM_CHECK_TIMEOUT_SECONDS = 2.0
+
+# How long an LLM backend result is reused. Model availability rarely
+# changes, but failures are re-checked quickly so recovery shows up fast.
+LLM_STATUS_CACHE_TTL_SECONDS = 30.0
+LLM_FAILURE_CACHE_TTL_SECONDS = 2.0
+
+# (backend, url, model) -> (monotonic timestamp, ServiceCheckResult)
+_llm_status_cache: Dict[tuple, tuple] = {}
+
+# Display name per llm_backend setting; the setting itself is the key the
+# backend is reported under in /health
+_LLM_BACKEND_NAMES = {"ollama": "Ollama", "vllm": "vLLM"}
+
+# Redis PING timeout for the health check
+REDIS_PING_TIMEOUT_SECONDS = 1.0
+
+# Services whose failure makes the whole application unhealthy
+CRITICAL_SERVICES = frozenset({"ollama", "vllm", "whisper", "api"})
+
+# Upper bound for any single service check in /health and /health/ready
+HEALTH_CHECK_TIMEOUT_SECONDS = 2.0
+
+# Readiness probes must answer quickly even on an LLM status cache miss
+READINESS_CHECK_TIMEOUT_SECONDS = 1.0
+
+
+@lru_cache(maxsize=1)
+def _get_llm_client() -> httpx.AsyncClient:
+    """
+    Shared HTTP client for LLM backend checks.
+
+    Keeps connections alive between probes so each check skips the TCP
+    handshake. Closed by close_health_clients() on shutdown.
+    """
+    return httpx.AsyncClient(
+        timeout=LLM_CHECK_TIMEOUT_SECONDS,
+        limits=httpx.Limits(max_keepalive_connections=4)
+    )
+
+
+async def close_health_clients() -> None:
+    """Close the shared LLM HTTP client (called on application shutdown)."""
+    if _get_llm_client.cache_info().currsize:
+        await _get_llm_client().aclose()
+        _get_llm_client.cache_clear()
+
 
 class ServiceStatus(str, Enum):
     """Service health status enumeration."""
@@ -77,10 +186,13 @@ class LivenessResponse(BaseModel):
     timestamp: str = Field(description="ISO 8601 timestamp")
 
 
-def check_redis(job_manager: JobManager) -> ServiceCheckResult:
+async def check_redis(job_manager: JobManager) -> ServiceCheckResult:
     """
     Check Redis connectivity and health.
 
+    Uses the job manager's async Redis client so an unreachable Redis never
+    blocks the event loop.
+
     Args:
         job_manager: JobManager instance with Redis client
 
@@ -88,17 +200,19 @@ def check_redis(job_manager: JobManager) -> ServiceCheckResult:
         ServiceCheckResult with Redis health status
     """
     try:
-        import time
         start_time = time.time()
 
-        if job_manager.redis_client is None:
+        if job_manager.async_redis is None:
             return ServiceCheckResult(
                 status=ServiceStatus.DEGRADED,
                 message="Redis not configured, using in-memory fallback"
             )
 
         # Test Redis with PING command
-        job_manager.redis_client.ping()
+        await asyncio.wait_for(
+            job_manager.async_redis.ping(),
+            timeout=REDIS_PING_TIMEOUT_SECONDS
+        )
         latency_ms = (time.time() - start_time) * 1000
 
         return ServiceCheckResult(
@@ -107,47 +221,101 @@ def check_redis(job_manager: JobManager) -> ServiceCheckResult:
             latency_ms=round(latency_ms, 2)
         )
     except Exception as e:
-        logger.warning(f"Redis health check failed: {e}")
+        logger.warning(f"Redis health check failed: {e!r}")
         return ServiceCheckResult(
             status=ServiceStatus.UNHEALTHY,
-            message=f"Connection failed: {str(e)}"
+            message=f"Connection failed: {str(e) or type(e).__name__}"
         )
 
 
-def check_ollama(pipeline: MedicalDocumentationPipeline, settings: Settings) -> ServiceCheckResult:
+async def check_llm(pipeline: "MedicalDocumentationPipeline", settings: Settings) -> ServiceCheckResult:
     """
-    Check Ollama LLM connectivity and model availability.
+    Check the configured LLM backend's connectivity and model availability.
 
-    This performs a lightweight HTTP check to Ollama's API instead of running
-    full LLM inference, making health checks fast (<2s instead of 8-62s).
+    This performs a lightweight HTTP check to the backend (Ollama's
+    /api/tags, or vLLM's /health) instead of running full LLM inference,
+    making health checks fast (<2s instead of 8-62s).
+    Uses a shared async client, so it never blocks the event loop.
 
     Args:
         pipeline: Pipeline instance with SOAP generator
         settings: Application settings
 
+    Returns:
+        ServiceCheckResult with the LLM backend's health status
+    """
+    return await _get_llm_status_cached(settings)
+
+
+async def _get_llm_status_cached(settings: Settings) -> ServiceCheckResult:
+    """
+    Return the LLM backend status, reusing a recent result when available.
+
+    Shared by /health and /health/ready. Results are cached for
+    LLM_STATUS_CACHE_TTL_SECONDS when healthy and
+    LLM_FAILURE_CACHE_TTL_SECONDS otherwise.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        ServiceCheckResult with the LLM backend's health status
+    """
+    if settings.llm_backend == "vllm":
+        cache_key = ("vllm", settings.vllm_health_url, settings.vllm_model)
+        fetch = _fetch_vllm_status
+    else:
+        cache_key = ("ollama", settings.ollama_base_url, settings.ollama_model)
+        fetch = _fetch_ollama_status
+
+    cached = _llm_status_cache.get(cache_key)
+    if cached is not None:
+        timestamp, result = cached
+        ttl = (
+            LLM_STATUS_CACHE_TTL_SECONDS
+            if result.status == ServiceStatus.HEALTHY
+            else LLM_FAILURE_CACHE_TTL_SECONDS
+        )
+        if time.monotonic() - timestamp < ttl:
+            return result
+
+    result = await fetch(settings)
+    _llm_status_cache[cache_key] = (time.monotonic(), result)
+    return result
+
+
+async def _fetch_ollama_status(settings: Settings) -> ServiceCheckResult:
+    """
+    Query Ollama's /api/tags and check the configured model is installed.
+
+    Args:
+        settings: Application settings
+
     Returns:
         ServiceCheckResult with Ollama health status
     """
     try:
-        import time
-        import requests
         start_time = time.time()
 
         # Use Ollama's /api/tags endpoint for lightweight model availability check
         # This is much faster than running full inference (llm.invoke)
-        response = requests.get(
-            f"{settings.ollama_base_url}/api/tags",
-            timeout=2  # 2 second timeout
+        response = await _get_llm_client().get(
+            settings.ollama_tags_url,
+            headers={"Accept": "application/json"}
         )
 
         if response.status_code == 200:
-            data = response.json()
-            models = data.get("models", [])
-            model_names = [m.get("name", "").split(":")[0] for m in models]  # Extract base name
+            data = orjson.loads(response.content)
+            # Base names only, e.g. "qwen3" from "qwen3:14b"
+            model_names = frozenset(
+                m["name"].split(":", 1)[0]
+                for m in data.get("models", ())
+                if m.get("name")
+            )
 
-            # Check if configured model exists (check base name, e.g., "qwen3" from "qwen3:14b")
-            configured_model_base = settings.ollama_model.split(":")[0]
-            model_exists = any(configured_model_base in name for name in model_names)
+            # Check if configured model exists (by base name)
+            configured_model_base = settings.ollama_model.split(":", 1)[0]
+            model_exists = configured_model_base in model_names
 
             if model_exists:
                 latency_ms = (time.time() - start_time) * 1000
@@ -159,7 +327,7 @@ def check_ollama(pipeline: MedicalDocumentationPipeline, settings: Settings) ->
             else:
                 return ServiceCheckResult(
                     status=ServiceStatus.UNHEALTHY,
-                    message=f"Model '{settings.ollama_model}' not found. Available: {', '.join(model_names)}. Run: ollama pull {settings.ollama_model}"
+                    message=f"Model '{settings.ollama_model}' not found. Available: {', '.join(sorted(model_names))}. Run: ollama pull {settings.ollama_model}"
                 )
         else:
             return ServiceCheckResult(
@@ -167,12 +335,12 @@ def check_ollama(pipeline: MedicalDocumentationPipeline, settings: Settings) ->
                 message=f"Ollama API returned status {response.status_code}"
             )
 
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         return ServiceCheckResult(
             status=ServiceStatus.UNHEALTHY,
-            message=f"Ollama connection timeout (2s) at {settings.ollama_base_url}"
+            message=f"Ollama connection timeout ({LLM_CHECK_TIMEOUT_SECONDS:g}s) at {settings.ollama_base_url}"
         )
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         logger.warning(f"Cannot connect to Ollama at {settings.ollama_base_url}")
         return ServiceCheckResult(
             status=ServiceStatus.UNHEALTHY,
@@ -186,7 +354,55 @@ def check_ollama(pipeline: MedicalDocumentationPipeline, settings: Settings) ->
         )
 
 
-def check_whisper(pipeline: MedicalDocumentationPipeline, settings: Settings) -> ServiceCheckResult:
+async def _fetch_vllm_status(settings: Settings) -> ServiceCheckResult:
+    """
+    Query the vLLM server's /health endpoint.
+
+    vLLM serves exactly one model (vllm_model), so a 200 means it is loaded.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        ServiceCheckResult with vLLM health status
+    """
+    try:
+        start_time = time.time()
+
+        response = await _get_llm_client().get(settings.vllm_health_url)
+
+        if response.status_code == 200:
+            latency_ms = (time.time() - start_time) * 1000
+            return ServiceCheckResult(
+                status=ServiceStatus.HEALTHY,
+                message=f"Serving model '{settings.vllm_model}'",
+                latency_ms=round(latency_ms, 2)
+            )
+        return ServiceCheckResult(
+            status=ServiceStatus.UNHEALTHY,
+            message=f"vLLM health endpoint returned status {response.status_code}"
+        )
+
+    except httpx.TimeoutException:
+        return ServiceCheckResult(
+            status=ServiceStatus.UNHEALTHY,
+            message=f"vLLM connection timeout ({LLM_CHECK_TIMEOUT_SECONDS:g}s) at {settings.vllm_base_url}"
+        )
+    except httpx.ConnectError:
+        logger.warning(f"Cannot connect to vLLM at {settings.vllm_base_url}")
+        return ServiceCheckResult(
+            status=ServiceStatus.UNHEALTHY,
+            message=f"Cannot connect to vLLM at {settings.vllm_base_url}"
+        )
+    except Exception as e:
+        logger.warning(f"vLLM health check failed: {e}")
+        return ServiceCheckResult(
+            status=ServiceStatus.UNHEALTHY,
+            message=f"Error: {str(e)}"
+        )
+
+
+def check_whisper(pipeline: "MedicalDocumentationPipeline", settings: Settings) -> ServiceCheckResult:
     """
     Check Whisper model availability.
 
@@ -234,8 +450,8 @@ def get_system_metrics() -> SystemMetrics:
         SystemMetrics with CPU, memory, and disk usage
     """
     try:
-        # CPU usage (1 second interval for accurate reading)
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        # CPU usage since the previous call (non-blocking; primed at import)
+        cpu_percent = psutil.cpu_percent(interval=None)
 
         # Memory usage
         memory = psutil.virtual_memory()
@@ -263,14 +479,49 @@ def get_system_metrics() -> SystemMetrics:
         )
 
 
+async def _bounded(
+    check: Awaitable[ServiceCheckResult],
+    name: str,
+    timeout: float = HEALTH_CHECK_TIMEOUT_SECONDS
+) -> ServiceCheckResult:
+    """
+    Await a service check with a hard timeout.
+
+    A hung dependency (e.g. a TCP connect that never completes) is reported
+    as UNHEALTHY instead of stalling the whole endpoint.
+
+    Args:
+        check: Awaitable producing the service's check result
+        name: Service name used in the timeout message
+        timeout: Maximum seconds to wait
+
+    Returns:
+        The check's result, or an UNHEALTHY result on timeout/error
+    """
+    try:
+        return await asyncio.wait_for(check, timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"{name} health check timed out after {timeout:g}s")
+        return ServiceCheckResult(
+            status=ServiceStatus.UNHEALTHY,
+            message=f"{name} check timed out after {timeout:g}s"
+        )
+    except Exception as e:
+        logger.warning(f"{name} health check failed: {e}")
+        return ServiceCheckResult(
+            status=ServiceStatus.UNHEALTHY,
+            message=f"Error: {str(e)}"
+        )
+
+
 def determine_overall_status(services: Dict[str, ServiceCheckResult]) -> HealthStatus:
     """
     Determine overall health status based on individual service statuses.
 
-    Logic:
-    - HEALTHY: All services are healthy or degraded (with graceful fallbacks)
-    - DEGRADED: At least one non-critical service is unhealthy
-    - UNHEALTHY: Critical services (Ollama, Whisper) are unhealthy
+    Logic (single pass, returns early on a critical failure):
+    - HEALTHY: All services are healthy
+    - DEGRADED: Any service is degraded, or a non-critical service is unhealthy
+    - UNHEALTHY: A critical service (API, LLM backend, Whisper) is unhealthy
 
     Args:
         services: Dictionary of service check results
@@ -278,28 +529,24 @@ def determine_overall_status(services: Dict[str, ServiceCheckResult]) -> HealthS
     Returns:
         Overall HealthStatus
     """
-    critical_services = ["ollama", "whisper", "api"]
+    has_issue = False
+    for service_name, check in services.items():
+        if check.status == ServiceStatus.UNHEALTHY:
+            # A critical service down makes the whole app unhealthy
+            if service_name in CRITICAL_SERVICES:
+                return HealthStatus.UNHEALTHY
+            has_issue = True
+        elif check.status == ServiceStatus.DEGRADED:
+            has_issue = True
 
-    # Check if any critical service is unhealthy
-    for service_name in critical_services:
-        if service_name in services and services[service_name].status == ServiceStatus.UNHEALTHY:
-            return HealthStatus.UNHEALTHY
-
-    # Check if any service is unhealthy or degraded
-    has_unhealthy = any(s.status == ServiceStatus.UNHEALTHY for s in services.values())
-    has_degraded = any(s.status == ServiceStatus.DEGRADED for s in services.values())
-
-    if has_unhealthy:
-        return HealthStatus.DEGRADED
-    elif has_degraded:
-        return HealthStatus.DEGRADED
-    else:
-        return HealthStatus.HEALTHY
+    # Non-critical failures and degraded services degrade overall health
+    return HealthStatus.DEGRADED if has_issue else HealthStatus.HEALTHY
 
 
 @router.get(
     "/health",
-    response_model=HealthCheckResponse,
+    response_model=None,
+    responses={200: {"model": HealthCheckResponse}},
     status_code=status.HTTP_200_OK,
     summary="Comprehensive health check",
     description="""
@@ -307,7 +554,7 @@ def determine_overall_status(services: Dict[str, ServiceCheckResult]) -> HealthS
 
     This endpoint verifies:
     - API service availability
-    - Ollama LLM connectivity and model availability
+    - LLM backend (Ollama or vLLM) connectivity and model availability
     - Redis connectivity (or in-memory fallback status)
     - Whisper model availability
     - System resource metrics (CPU, memory, disk)
@@ -317,36 +564,79 @@ def determine_overall_status(services: Dict[str, ServiceCheckResult]) -> HealthS
     """
 )
 async def health_check(
-    pipeline: MedicalDocumentationPipeline = Depends(get_pipeline),
+    pipeline: "MedicalDocumentationPipeline" = Depends(get_pipeline),
     job_manager: JobManager = Depends(get_job_manager),
     settings: Settings = Depends(get_settings)
-) -> HealthCheckResponse:
+) -> ORJSONResponse:
     """
     Perform comprehensive health check of all services.
 
+    Results are cached for HEALTH_CACHE_TTL_SECONDS so frequent probes
+    don't each re-run the downstream checks. The cached body is a plain
+    dict (shaped like HealthCheckResponse) serialized directly by orjson,
+    skipping response-model validation.
+
     Args:
         pipeline: Injected pipeline instance
         job_manager: Injected job manager instance
         settings: Injected application settings
 
     Returns:
-        HealthCheckResponse with detailed service statuses and system metrics
+        ORJSONResponse with detailed service statuses and system metrics
+    """
+    body = await _health_cache.get(
+        lambda: _compute_health_check(pipeline, job_manager, settings)
+    )
+    return ORJSONResponse(body)
+
+
+async def _compute_health_check(
+    pipeline: "MedicalDocumentationPipeline",
+    job_manager: JobManager,
+    settings: Settings
+) -> Dict[str, Any]:
+    """
+    Run every service check and build a fresh health check body.
+
+    Args:
+        pipeline: Pipeline instance
+        job_manager: Job manager instance
+        settings: Application settings
+
+    Returns:
+        Dict matching the HealthCheckResponse schema
     """
     logger.debug("Performing comprehensive health check")
 
-    # Check all services
+    # Run all checks concurrently (blocking ones in worker threads), so
+    # total latency is the slowest check rather than the sum
+    llm_name = _LLM_BACKEND_NAMES[settings.llm_backend]
+    redis_result, llm_result, whisper_result, system_metrics = await asyncio.gather(
+        _bounded(check_redis(job_manager), "Redis"),
+        _bounded(check_llm(pipeline, settings), llm_name),
+        _bounded(asyncio.to_thread(check_whisper, pipeline, settings), "Whisper"),
+        asyncio.wait_for(asyncio.to_thread(get_system_metrics), HEALTH_CHECK_TIMEOUT_SECONDS),
+        return_exceptions=True
+    )
+
     services = {
         "api": ServiceCheckResult(
             status=ServiceStatus.HEALTHY,
             message="API is running"
         ),
-        "redis": check_redis(job_manager),
-        "ollama": check_ollama(pipeline, settings),
-        "whisper": check_whisper(pipeline, settings)
+        "redis": redis_result,
+        settings.llm_backend: llm_result,
+        "whisper": whisper_result
     }
 
-    # Gather system metrics
-    system_metrics = get_system_metrics()
+    if isinstance(system_metrics, BaseException):
+        logger.error(f"Failed to gather system metrics: {system_metrics!r}")
+        system_metrics = SystemMetrics(
+            cpu_percent=0.0,
+            memory_percent=0.0,
+            memory_available_mb=0.0,
+            disk_usage_percent=0.0
+        )
 
     # Determine overall status
     overall_status = determine_overall_status(services)
@@ -360,24 +650,28 @@ async def health_check(
         ]
         logger.warning(f"Unhealthy/degraded services: {unhealthy_services}")
 
-    return HealthCheckResponse(
-        status=overall_status,
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        services=services,
-        system_metrics=system_metrics
-    )
+    return {
+        "status": overall_status.value,
+        "timestamp": _now_iso(),
+        "services": {
+            name: check.model_dump(mode="json")
+            for name, check in services.items()
+        },
+        "system_metrics": system_metrics.model_dump()
+    }
 
 
 @router.get(
     "/health/ready",
-    response_model=ReadinessResponse,
+    response_model=None,
+    responses={200: {"model": ReadinessResponse}},
     status_code=status.HTTP_200_OK,
     summary="Kubernetes readiness probe",
     description="""
     Kubernetes readiness probe endpoint.
 
     This endpoint checks if the application is ready to serve traffic.
-    It verifies that critical services (Ollama, Whisper) are available.
+    It verifies that critical services (LLM backend, Whisper) are available.
 
     Returns:
     - HTTP 200 if ready to serve traffic
@@ -385,15 +679,15 @@ async def health_check(
     """
 )
 async def readiness_probe(
-    pipeline: MedicalDocumentationPipeline = Depends(get_pipeline),
+    pipeline: "MedicalDocumentationPipeline" = Depends(get_pipeline),
     settings: Settings = Depends(get_settings)
-) -> ReadinessResponse:
+) -> ORJSONResponse:
     """
     Check if the application is ready to serve traffic.
 
     Readiness means:
     - Pipeline is loaded
-    - Ollama is accessible
+    - The LLM backend (Ollama or vLLM) is accessible
     - Whisper model can be loaded
 
     Args:
@@ -401,7 +695,7 @@ async def readiness_probe(
         settings: Injected application settings
 
     Returns:
-        ReadinessResponse with ready status
+        ORJSONResponse with ready status (ReadinessResponse schema)
 
     Raises:
         HTTPException: 503 if not ready
@@ -409,31 +703,35 @@ async def readiness_probe(
     try:
         # Check pipeline is loaded
         if pipeline is None:
-            from fastapi import HTTPException
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Pipeline not initialized"
             )
 
-        # Quick check for Ollama (don't wait for full test)
-        ollama_result = check_ollama(pipeline, settings)
-        if ollama_result.status == ServiceStatus.UNHEALTHY:
-            from fastapi import HTTPException
+        # Quick check for the LLM backend from the shared status cache. On a
+        # miss the fetch is shielded so it still refreshes the cache if we
+        # time out.
+        llm_name = _LLM_BACKEND_NAMES[settings.llm_backend]
+        llm_result = await _bounded(
+            asyncio.shield(_get_llm_status_cached(settings)),
+            llm_name,
+            timeout=READINESS_CHECK_TIMEOUT_SECONDS
+        )
+        if llm_result.status == ServiceStatus.UNHEALTHY:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Ollama not ready: {ollama_result.message}"
+                detail=f"{llm_name} not ready: {llm_result.message}"
             )
 
         logger.debug("Readiness probe: READY")
-        return ReadinessResponse(
-            status="ready",
-            message="Application is ready to serve traffic",
-            timestamp=datetime.utcnow().isoformat() + "Z"
-        )
+        return ORJSONResponse({
+            "status": "ready",
+            "message": "Application is ready to serve traffic",
+            "timestamp": _now_iso()
+        })
 
     except Exception as e:
         logger.warning(f"Readiness probe failed: {e}")
-        from fastapi import HTTPException
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Not ready: {str(e)}"
@@ -442,7 +740,8 @@ async def readiness_probe(
 
 @router.get(
     "/health/live",
-    response_model=LivenessResponse,
+    response_model=None,
+    responses={200: {"model": LivenessResponse}},
     status_code=status.HTTP_200_OK,
     summary="Kubernetes liveness probe",
     description="""
@@ -455,7 +754,7 @@ async def readiness_probe(
     - HTTP 200 if the application process is running
     """
 )
-async def liveness_probe() -> LivenessResponse:
+async def liveness_probe() -> ORJSONResponse:
     """
     Check if the application process is alive.
 
@@ -463,10 +762,10 @@ async def liveness_probe() -> LivenessResponse:
     It does not check external dependencies - that's what readiness is for.
 
     Returns:
-        LivenessResponse with alive status
+        ORJSONResponse with alive status (LivenessResponse schema)
     """
     logger.debug("Liveness probe: ALIVE")
-    return LivenessResponse(
-        status="alive",
-        timestamp=datetime.utcnow().isoformat() + "Z"
-    )
+    return ORJSONResponse({
+        "status": "alive",
+        "timestamp": _now_iso()
+    })
@@ -9,21 +9,22 @@ from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, s
 from typing import Optional
 from datetime import datetime
 
-from api.dependencies import get_job_manager, get_current_user_optional
+from api.dependencies import get_job_manager, get_current_user_optional, get_file_handler
+from api.middleware.rate_limiter import rate_limit
 from api.models.requests import GenerateSOAPRequest
 from api.models.responses import JobResponse, JobStatusResponse, JobStatus
 from api.utils.file_handler import FileHandler
 from api.services.job_manager import JobManager
-from tasks import process_audio_task, transcribe_audio_task, generate_soap_task
 
 router = APIRouter()
 
 
-@router.post("/process", response_model=JobResponse)
+@router.post("/process", response_model=JobResponse, dependencies=[Depends(rate_limit)])
 async def submit_process_job(
     file: UploadFile = File(..., description="Audio file to process"),
     user: Optional[dict] = Depends(get_current_user_optional),
-    job_manager: JobManager = Depends(get_job_manager)
+    job_manager: JobManager = Depends(get_job_manager),
+    file_handler: FileHandler = Depends(get_file_handler)
 ):
     """
     Submit a full pipeline processing job (audio → transcription → SOAP note).
@@ -34,12 +35,11 @@ async def submit_process_job(
         file: Audio file (mp3, wav, m4a, flac)
         user: Optional authenticated user
         job_manager: Job manager instance
+        file_handler: Shared file handler instance
 
     Returns:
         JobResponse with job_id and initial status
     """
-    file_handler = FileHandler()
-
     # Create job
     job_id = job_manager.create_job(
         job_type="process",
@@ -52,7 +52,8 @@ async def submit_process_job(
     # Save uploaded file
     temp_path = await file_handler.save_upload_file(file, job_id)
 
-    # Submit to Celery
+    # Submit to Celery (tasks is imported on use: it pulls in the ML pipeline)
+    from tasks import process_audio_task
     process_audio_task.delay(job_id, str(temp_path))
 
     return JobResponse(
@@ -63,11 +64,12 @@ async def submit_process_job(
     )
 
 
-@router.post("/transcribe", response_model=JobResponse)
+@router.post("/transcribe", response_model=JobResponse, dependencies=[Depends(rate_limit)])
 async def submit_transcribe_job(
     file: UploadFile = File(..., description="Audio file to transcribe"),
     user: Optional[dict] = Depends(get_current_user_optional),
-    job_manager: JobManager = Depends(get_job_manager)
+    job_manager: JobManager = Depends(get_job_manager),
+    file_handler: FileHandler = Depends(get_file_handler)
 ):
     """
     Submit a transcription-only job (no SOAP note generation).
@@ -76,12 +78,11 @@ async def submit_transcribe_job(
         file: Audio file (mp3, wav, m4a, flac)
         user: Optional authenticated user
         job_manager: Job manager instance
+        file_handler: Shared file handler instance
 
     Returns:
         JobResponse with job_id and initial status
     """
-    file_handler = FileHandler()
-
     job_id = job_manager.create_job(
         job_type="transcribe",
         metadata={
@@ -91,6 +92,8 @@ async def submit_transcribe_job(
     )
 
     temp_path = await file_handler.save_upload_file(file, job_id)
+    # Imported on use: tasks pulls in the ML pipeline
+    from tasks import transcribe_audio_task
     transcribe_audio_task.delay(job_id, str(temp_path))
 
     return JobResponse(
@@ -101,7 +104,7 @@ async def submit_transcribe_job(
     )
 
 
-@router.post("/generate-soap", response_model=JobResponse)
+@router.post("/generate-soap", response_model=JobResponse, dependencies=[Depends(rate_limit)])
 async def submit_soap_generation_job(
     request: GenerateSOAPRequest,
     user: Optional[dict] = Depends(get_current_user_optional),
@@ -129,6 +132,8 @@ async def submit_soap_generation_job(
         }
     )
 
+    # Imported on use: tasks pulls in the ML pipeline
+    from tasks import generate_soap_task
     generate_soap_task.delay(job_id, request.transcription, request.language)
 
     return JobResponse(
@@ -189,18 +194,20 @@ async def get_job_result(
         404: Job not found
         400: Job not completed yet
     """
-    job_data = job_manager.get_job(job_id)
+    # Status and result come back from one Redis GET
+    job_result = job_manager.get_job_result(job_id)
 
-    if not job_data:
+    if job_result is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_id} not found. It may have expired or never existed."
         )
 
-    if job_data["status"] != "completed":
+    job_status, result = job_result
+    if job_status != "completed":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Job is not completed yet. Current status: {job_data['status']}"
+            detail=f"Job is not completed yet. Current status: {job_status}"
         )
 
-    return job_data["result"]
+    return result
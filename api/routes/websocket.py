@@ -5,20 +5,60 @@ WebSocket Endpoints
 Real-time job progress streaming via WebSocket.
 """
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
 import redis.asyncio as aioredis
-import json
 import asyncio
-from typing import Optional
+import orjson
 
 from config import get_settings
+from api.dependencies import get_job_manager
 from api.services.job_manager import JobManager
 
 router = APIRouter()
 
+# Seconds of silence on a job channel before a heartbeat frame is sent
+HEARTBEAT_INTERVAL_SECONDS = 30.0
+
+# Progress updates arriving within this window are merged into one frame
+UPDATE_COALESCE_WINDOW_SECONDS = 0.05
+
+# Job statuses after which no further updates are published
+TERMINAL_STATUSES = ("completed", "failed")
+
+# Shared pool for pub/sub subscribers - each stream borrows a connection
+# instead of opening (and tearing down) its own Redis client. Responses stay
+# as bytes: orjson parses them directly without a UTF-8 decode first.
+_settings = get_settings()
+_redis_pool = aioredis.ConnectionPool(
+    host=_settings.redis_host,
+    port=_settings.redis_port,
+    db=_settings.redis_db,
+    password=_settings.redis_password or None,
+    max_connections=32
+)
+
+
+async def _send_json(websocket: WebSocket, data: dict) -> None:
+    """
+    Send a JSON text frame encoded with orjson.
+
+    Text (not binary) frames, so browser clients can keep using
+    JSON.parse(event.data).
+    """
+    await websocket.send_text(orjson.dumps(data).decode())
+
+
+async def close_redis_pool() -> None:
+    """Disconnect the shared pub/sub connection pool (called on shutdown)."""
+    await _redis_pool.disconnect()
+
 
 @router.websocket("/jobs/{job_id}/stream")
-async def websocket_job_stream(websocket: WebSocket, job_id: str):
+async def websocket_job_stream(
+    websocket: WebSocket,
+    job_id: str,
+    job_manager: JobManager = Depends(get_job_manager)
+):
     """
     WebSocket endpoint for real-time job progress updates.
 
@@ -27,6 +67,7 @@ async def websocket_job_stream(websocket: WebSocket, job_id: str):
     Args:
         websocket: FastAPI WebSocket connection
         job_id: Unique job identifier
+        job_manager: Injected job manager instance
 
     Usage:
         ```javascript
@@ -34,8 +75,15 @@ async def websocket_job_stream(websocket: WebSocket, job_id: str):
 
         ws.onmessage = (event) => {
             const data = JSON.parse(event.data);
+            if (data.type === 'heartbeat') return;  // keep-alive, no update
+
             console.log(`Progress: ${data.progress}% - ${data.current_stage}`);
 
+            // SOAP generation jobs stream sections as they are written
+            if (data.partial_result) {
+                console.log('Sections so far:', data.partial_result);
+            }
+
             if (data.status === 'completed') {
                 console.log('Job completed!', data.result);
             } else if (data.status === 'failed') {
@@ -46,16 +94,13 @@ async def websocket_job_stream(websocket: WebSocket, job_id: str):
     """
     await websocket.accept()
 
-    settings = get_settings()
-    job_manager = JobManager()
-    redis_client: Optional[aioredis.Redis] = None
     pubsub = None
 
     try:
         # Verify job exists
         job_data = job_manager.get_job(job_id)
         if not job_data:
-            await websocket.send_json({
+            await _send_json(websocket, {
                 "error": "Job not found",
                 "job_id": job_id,
                 "message": f"No job found with ID: {job_id}"
@@ -64,50 +109,69 @@ async def websocket_job_stream(websocket: WebSocket, job_id: str):
             return
 
         # Send initial status
-        await websocket.send_json(job_data)
+        await _send_json(websocket, job_data)
 
         # If job is already completed or failed, close connection
-        if job_data.get("status") in ["completed", "failed"]:
+        if job_data.get("status") in TERMINAL_STATUSES:
             await websocket.close(code=status.WS_1000_NORMAL_CLOSURE)
             return
 
-        # Subscribe to Redis pub/sub for updates
-        redis_client = aioredis.Redis(
-            host=settings.redis_host,
-            port=settings.redis_port,
-            db=settings.redis_db,
-            password=settings.redis_password or None,
-            decode_responses=True
-        )
-
-        pubsub = redis_client.pubsub()
+        # Subscribe to Redis pub/sub for updates (connection from shared pool)
+        redis_client = aioredis.Redis(connection_pool=_redis_pool)
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
         await pubsub.subscribe(f"job_updates:{job_id}")
 
-        # Listen for updates
-        async for message in pubsub.listen():
-            if message["type"] == "message":
-                try:
-                    # Parse and send update to client
-                    data = json.loads(message["data"])
-                    await websocket.send_json(data)
-
-                    # Close connection if job is completed or failed
-                    if data.get("status") in ["completed", "failed"]:
-                        await websocket.close(code=status.WS_1000_NORMAL_CLOSURE)
-                        break
+        # Wait for updates; send a heartbeat if the job is quiet for a while
+        loop = asyncio.get_running_loop()
+        last_sent = loop.time()
+        while True:
+            message = await pubsub.get_message(timeout=HEARTBEAT_INTERVAL_SECONDS)
+            if message is None:
+                if loop.time() - last_sent >= HEARTBEAT_INTERVAL_SECONDS:
+                    await _send_json(websocket, {"type": "heartbeat"})
+                    last_sent = loop.time()
+                continue
 
-                except json.JSONDecodeError as e:
-                    # Log error but continue listening
-                    await websocket.send_json({
-                        "error": "Invalid message format",
-                        "message": f"Failed to parse update: {str(e)}"
-                    })
-                except Exception as e:
-                    # Send error to client but continue
-                    await websocket.send_json({
-                        "error": "Update processing error",
-                        "message": str(e)
-                    })
+            try:
+                data = orjson.loads(message["data"])
+
+                # Coalesce bursts: keep only the newest update that arrives
+                # within the window. Terminal updates are never delayed.
+                deadline = loop.time() + UPDATE_COALESCE_WINDOW_SECONDS
+                while data.get("status") not in TERMINAL_STATUSES:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    next_message = await pubsub.get_message(timeout=remaining)
+                    if next_message is None:
+                        break
+                    try:
+                        data = orjson.loads(next_message["data"])
+                    except orjson.JSONDecodeError:
+                        # Skip it and keep the last good update
+                        continue
+
+                # Send the latest update to client
+                await _send_json(websocket, data)
+                last_sent = loop.time()
+
+                # Close connection if job is completed or failed
+                if data.get("status") in TERMINAL_STATUSES:
+                    await websocket.close(code=status.WS_1000_NORMAL_CLOSURE)
+                    break
+
+            except orjson.JSONDecodeError as e:
+                # Log error but continue listening
+                await _send_json(websocket, {
+                    "error": "Invalid message format",
+                    "message": f"Failed to parse update: {str(e)}"
+                })
+            except Exception as e:
+                # Send error to client but continue
+                await _send_json(websocket, {
+                    "error": "Update processing error",
+                    "message": str(e)
+                })
 
     except WebSocketDisconnect:
         # Client disconnected - clean up silently
@@ -116,7 +180,7 @@ async def websocket_job_stream(websocket: WebSocket, job_id: str):
     except Exception as e:
         # Unexpected error - try to send error message before closing
         try:
-            await websocket.send_json({
+            await _send_json(websocket, {
                 "error": "Internal server error",
                 "message": f"An unexpected error occurred: {str(e)}"
             })
@@ -124,7 +188,8 @@ async def websocket_job_stream(websocket: WebSocket, job_id: str):
             pass  # Connection might already be closed
 
     finally:
-        # Cleanup Redis resources
+        # Cleanup Redis resources - releases the connection back to the
+        # shared pool; the pool itself stays open
         if pubsub:
             try:
                 await pubsub.unsubscribe(f"job_updates:{job_id}")
@@ -132,12 +197,6 @@ async def websocket_job_stream(websocket: WebSocket, job_id: str):
             except:
                 pass  # Best effort cleanup
 
-        if redis_client:
-            try:
-                await redis_client.close()
-            except:
-                pass  # Best effort cleanup
-
         # Ensure WebSocket is closed
         try:
             await websocket.close()
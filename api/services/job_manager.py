@@ -6,14 +6,114 @@ Redis-based job queue and status management.
 Stub implementation for Phase 2, fully implemented in Phase 5.
 """
 
-import json
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
+
+import msgspec
 
 from config import get_settings
 
 
+class JobRecord(msgspec.Struct):
+    """
+    Schema of a job as stored in Redis and published to subscribers.
+    
+    Also the in-memory representation when Redis is unavailable: a Struct
+    has a fixed slot layout, far smaller than a per-job dict.
+    """
+    job_id: str
+    job_type: str
+    status: str = "pending"
+    progress: int = 0
+    current_stage: Optional[str] = None
+    result: Any = None
+    # SOAP sections generated so far, while a generate_soap job streams
+    partial_result: Optional[Dict[str, str]] = None
+    error: Optional[Dict[str, Any]] = None
+    metadata: Dict[str, Any] = {}
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+
+# Shared codecs - built once, reused for every Redis read/write
+_ENCODER = msgspec.json.Encoder()
+_DECODER = msgspec.json.Decoder(JobRecord)
+
+# Fields a job update may set
+_JOB_FIELDS = frozenset(JobRecord.__struct_fields__)
+
+# Resolved once at import; JobManager is constructed per Celery task
+_SETTINGS = get_settings()
+
+# Jobs are stored as Redis hashes of {field name: JSON-encoded value}, so
+# an update only writes the fields it changes and no value is ever
+# decoded and re-encoded server-side.
+
+# Atomic update for update_job: set the changed fields, refresh the TTL
+# and publish the whole record, all in one round trip.
+# KEYS: job key, updates channel
+# ARGV: ttl, then field / JSON-encoded value pairs (updated_at last)
+# The published JSON is spliced together from the stored values as-is.
+# Field names are JobRecord attributes, so they need no escaping.
+_UPDATE_JOB_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+local fields = redis.call('HGETALL', KEYS[1])
+local parts = {}
+for i = 1, #fields, 2 do
+    parts[#parts + 1] = '"' .. fields[i] .. '":' .. fields[i + 1]
+end
+redis.call('PUBLISH', KEYS[2], '{' .. table.concat(parts, ',') .. '}')
+return 1
+"""
+
+
+def _encode_job_fields(job: JobRecord) -> Dict[str, bytes]:
+    """Encode each field of a job as a JSON value for its Redis hash."""
+    return {
+        field: _ENCODER.encode(getattr(job, field))
+        for field in JobRecord.__struct_fields__
+    }
+
+
+def _decode_job_hash(fields: Dict[bytes, bytes]) -> JobRecord:
+    """Rebuild a JobRecord from its Redis hash without re-encoding values."""
+    return _DECODER.decode(
+        b"{" + b",".join(b'"' + name + b'":' + value for name, value in fields.items()) + b"}"
+    )
+
+# Upper bound on pooled connections per process
+REDIS_MAX_CONNECTIONS = 64
+
+
+@lru_cache(maxsize=1)
+def get_redis_pool():
+    """
+    Get the process-wide Redis connection pool for job storage.
+
+    Every JobManager (API lifespan, each Celery task) borrows connections
+    from this pool instead of opening its own TCP connection. redis-py
+    uses the hiredis C parser automatically when it is installed.
+
+    Returns:
+        redis.ConnectionPool shared by all sync job clients
+    """
+    import redis
+    return redis.ConnectionPool(
+        host=_SETTINGS.redis_host,
+        port=_SETTINGS.redis_port,
+        db=_SETTINGS.redis_db,
+        password=_SETTINGS.redis_password or None,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        socket_connect_timeout=2
+    )
+
+
 class JobManager:
     """
     Manage job queue and status using Redis.
@@ -29,27 +129,40 @@ class JobManager:
         In Phase 2: Uses in-memory dict (non-persistent)
         In Phase 5: Will use Redis for persistence
         """
-        self.settings = get_settings()
-        self._jobs: Dict[str, Dict[str, Any]] = {}  # In-memory storage
+        self.settings = _SETTINGS
+        self._jobs: Dict[str, JobRecord] = {}  # In-memory storage
         self.job_ttl = 86400  # 24 hours
         
         # Try to connect to Redis (optional in Phase 2)
         self.redis_client = None
         try:
             import redis
-            self.redis_client = redis.Redis(
+            self.redis_client = redis.Redis(connection_pool=get_redis_pool())
+            # Test connection
+            self.redis_client.ping()
+            # EVALSHA with automatic script load on first use
+            self._update_job_script = self.redis_client.register_script(
+                _UPDATE_JOB_SCRIPT
+            )
+        except Exception:
+            # Redis not available - use in-memory fallback
+            self.redis_client = None
+        
+        # Async client for non-blocking checks from the API event loop
+        # (health checks). Connects lazily; short timeouts so an unreachable
+        # Redis fails fast instead of hanging the caller.
+        self.async_redis = None
+        if self.redis_client is not None:
+            import redis.asyncio as aioredis
+            self.async_redis = aioredis.Redis(
                 host=self.settings.redis_host,
                 port=self.settings.redis_port,
                 db=self.settings.redis_db,
                 password=self.settings.redis_password or None,
                 decode_responses=True,
-                socket_connect_timeout=2
+                socket_timeout=1.0,
+                socket_connect_timeout=1.0
             )
-            # Test connection
-            self.redis_client.ping()
-        except Exception:
-            # Redis not available - use in-memory fallback
-            self.redis_client = None
     
     def create_job(self, job_type: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -62,31 +175,27 @@ class JobManager:
         Returns:
             job_id: Unique job identifier
         """
-        job_id = str(uuid.uuid4())
-        
-        job_data = {
-            "job_id": job_id,
-            "job_type": job_type,
-            "status": "pending",
-            "progress": 0,
-            "current_stage": None,
-            "result": None,
-            "error": None,
-            "metadata": metadata or {},
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat()
-        }
+        job_id = uuid.uuid4().hex
+        now_iso = datetime.utcnow().isoformat()
+        
+        job = JobRecord(
+            job_id=job_id,
+            job_type=job_type,
+            metadata=metadata or {},
+            created_at=now_iso,
+            updated_at=now_iso
+        )
         
         if self.redis_client:
-            # Store in Redis with TTL
-            self.redis_client.setex(
-                f"job:{job_id}",
-                self.job_ttl,
-                json.dumps(job_data)
-            )
+            # Store in Redis with TTL (one round trip)
+            key = f"job:{job_id}"
+            pipe = self.redis_client.pipeline()
+            pipe.hset(key, mapping=_encode_job_fields(job))
+            pipe.expire(key, self.job_ttl)
+            pipe.execute()
         else:
             # Store in memory
-            self._jobs[job_id] = job_data
+            self._jobs[job_id] = job
         
         return job_id
     
@@ -101,12 +210,40 @@ class JobManager:
             Job data dict or None if not found
         """
         if self.redis_client:
-            data = self.redis_client.get(f"job:{job_id}")
-            if data:
-                return json.loads(data)
+            fields = self.redis_client.hgetall(f"job:{job_id}")
+            if fields:
+                return msgspec.structs.asdict(_decode_job_hash(fields))
             return None
         else:
-            return self._jobs.get(job_id)
+            job = self._jobs.get(job_id)
+            return msgspec.structs.asdict(job) if job is not None else None
+    
+    def get_job_result(self, job_id: str) -> Optional[Tuple[str, Any]]:
+        """
+        Get a job's status and result in a single lookup.
+        
+        Used by the result endpoint, which only needs these two fields.
+        
+        Args:
+            job_id: The job identifier
+            
+        Returns:
+            (status, result) tuple or None if not found
+        """
+        if self.redis_client:
+            # Only the two fields, not the whole record
+            status, result = self.redis_client.hmget(f"job:{job_id}", "status", "result")
+            if status is None:
+                return None
+            return (
+                msgspec.json.decode(status),
+                msgspec.json.decode(result) if result is not None else None
+            )
+        else:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return job.status, job.result
     
     def update_job(self, job_id: str, updates: Dict[str, Any]) -> None:
         """
@@ -115,27 +252,40 @@ class JobManager:
         Args:
             job_id: The job identifier
             updates: Dict of fields to update
+            
+        Raises:
+            ValueError: If the job doesn't exist or a field is unknown
         """
-        job_data = self.get_job(job_id)
-        if not job_data:
-            raise ValueError(f"Job {job_id} not found")
+        unknown = updates.keys() - _JOB_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown job field(s): {', '.join(sorted(unknown))}")
         
-        job_data.update(updates)
-        job_data["updated_at"] = datetime.utcnow().isoformat()
+        now_iso = datetime.utcnow().isoformat()
         
         if self.redis_client:
-            self.redis_client.setex(
-                f"job:{job_id}",
-                self.job_ttl,
-                json.dumps(job_data)
-            )
-            # Publish update for WebSocket subscribers (Phase 6)
-            self.redis_client.publish(
-                f"job_updates:{job_id}",
-                json.dumps(job_data)
+            # Patch, store and publish server-side in a single round trip
+            args = [self.job_ttl]
+            for field, value in updates.items():
+                args.append(field)
+                args.append(_ENCODER.encode(value))
+            args.append("updated_at")
+            args.append(_ENCODER.encode(now_iso))
+            
+            found = self._update_job_script(
+                keys=[f"job:{job_id}", f"job_updates:{job_id}"],
+                args=args
             )
+            if not found:
+                raise ValueError(f"Job {job_id} not found")
         else:
-            self._jobs[job_id] = job_data
+            # Patch the stored record in place
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise ValueError(f"Job {job_id} not found")
+            
+            for field, value in updates.items():
+                setattr(job, field, value)
+            job.updated_at = now_iso
     
     def set_job_progress(self, job_id: str, progress: int, stage: str) -> None:
         """
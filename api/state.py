@@ -0,0 +1,14 @@
+"""
+Application State
+=================
+
+Process-wide application state shared between the FastAPI app and its
+dependencies. Lives in its own module so api.dependencies can import it
+at module scope without a circular import through api.main.
+"""
+
+from typing import Dict, Any
+
+
+# Global application state - stores pipeline and other singletons
+app_state: Dict[str, Any] = {}
@@ -3,11 +3,14 @@ File Upload Handler
 ===================
 
 Async file upload handling with validation and cleanup.
+File IO runs in a worker thread, one hop per upload.
 """
 
-import aiofiles
+import asyncio
+import io
+import logging
 import os
-import tempfile
+import shutil
 from pathlib import Path
 from typing import Optional
 from fastapi import UploadFile, HTTPException, status
@@ -16,17 +19,49 @@ from config import get_settings
 from exceptions import UnsupportedAudioFormatError
 
 
+# Set up module logger
+logger = logging.getLogger(__name__)
+
+# Upload streaming chunk size (1 MiB): few read/write calls per file while
+# keeping peak memory per upload bounded
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _is_on_disk(src) -> bool:
+    """
+    Whether an upload's file object is backed by a real file descriptor.
+
+    Starlette spools uploads in a SpooledTemporaryFile, where fileno()
+    would force an in-memory upload to disk. For those, read the private
+    _rolled flag that CPython's tempfile sets on rollover. If a Python
+    release drops it, fall back to fileno(): still correct, at worst an
+    extra disk write for a small upload.
+    """
+    rolled = getattr(src, "_rolled", None)
+    if rolled is not None:
+        return rolled
+    try:
+        src.fileno()
+    except (io.UnsupportedOperation, AttributeError, OSError):
+        return False
+    return True
+
+
 class FileHandler:
     """Handle file uploads and temporary file management."""
 
     def __init__(self):
         """Initialize FileHandler with settings from config."""
         self.settings = get_settings()
-        self.temp_dir = Path(self.settings.temp_file_dir or tempfile.gettempdir())
+        self.temp_dir = self.settings.temp_path
         self.temp_dir.mkdir(parents=True, exist_ok=True)
 
         self.max_size_bytes = self.settings.max_upload_size_mb * 1024 * 1024
-        self.allowed_formats = self.settings.allowed_audio_formats
+        # Set for O(1) extension checks; sorted list for rejections built once
+        self.allowed_formats = frozenset(
+            fmt.lower() for fmt in self.settings.allowed_audio_formats
+        )
+        self._allowed_formats_sorted = sorted(self.allowed_formats)
 
     async def save_upload_file(self, upload_file: UploadFile, job_id: str) -> Path:
         """
@@ -53,45 +88,40 @@ class FileHandler:
         file_ext = Path(upload_file.filename).suffix.lower()
         if file_ext not in self.allowed_formats:
             raise UnsupportedAudioFormatError(
-                f"File format '{file_ext}' not supported. "
-                f"Allowed formats: {', '.join(self.allowed_formats)}"
+                upload_file.filename,
+                file_ext,
+                self._allowed_formats_sorted
+            )
+
+        # Reject oversized uploads up front when the size is already known;
+        # the copy helpers still enforce the limit when it isn't
+        declared_size = getattr(upload_file, "size", None)
+        if declared_size is not None and declared_size > self.max_size_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large. Maximum size: {self.settings.max_upload_size_mb}MB"
             )
 
         # Create temp file path with job ID and original extension
         temp_file_path = self.temp_dir / f"{job_id}{file_ext}"
 
-        # Save file with size validation (chunked upload)
-        total_size = 0
-        chunk_size = 8192  # 8KB chunks
+        # Copy in a single worker-thread hop with plain blocking file IO;
+        # large uploads already spooled to disk by Starlette are copied
+        # file-to-file in the kernel
+        if _is_on_disk(upload_file.file):
+            copy_upload = self._copy_spooled_file
+        else:
+            copy_upload = self._copy_upload_stream
 
         try:
-            async with aiofiles.open(temp_file_path, 'wb') as f:
-                while True:
-                    chunk = await upload_file.read(chunk_size)
-                    if not chunk:
-                        break
-
-                    total_size += len(chunk)
-
-                    # Check file size limit
-                    if total_size > self.max_size_bytes:
-                        # Clean up partial file
-                        await f.close()
-                        temp_file_path.unlink(missing_ok=True)
-
-                        raise HTTPException(
-                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                            detail=f"File too large. Maximum size: {self.settings.max_upload_size_mb}MB"
-                        )
-
-                    await f.write(chunk)
-
+            await asyncio.to_thread(copy_upload, upload_file.file, temp_file_path)
         except HTTPException:
-            # Re-raise HTTP exceptions
+            # Clean up partial file, re-raise HTTP exceptions
+            await self.cleanup_file_async(temp_file_path)
             raise
         except Exception as e:
             # Clean up on any error
-            temp_file_path.unlink(missing_ok=True)
+            await self.cleanup_file_async(temp_file_path)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error saving file: {str(e)}"
@@ -99,6 +129,86 @@ class FileHandler:
 
         return temp_file_path
 
+    def _copy_upload_stream(self, src, dest_path: Path) -> None:
+        """
+        Stream an upload to dest_path in chunks (runs in a worker thread).
+
+        Peak memory is one chunk buffer regardless of upload size.
+
+        Args:
+            src: File object backing the UploadFile
+            dest_path: Destination path for the saved upload
+
+        Raises:
+            HTTPException: If file size exceeds limit
+        """
+        total_size = 0
+
+        # Reuse one buffer for every chunk when the source supports
+        # readinto(); otherwise fall back to read() (a new bytes per chunk)
+        buffer = bytearray(UPLOAD_CHUNK_SIZE)
+        view = memoryview(buffer)
+        readinto = getattr(src, "readinto", None)
+
+        with open(dest_path, 'wb', buffering=UPLOAD_CHUNK_SIZE) as dst:
+            while True:
+                if readinto is not None:
+                    n = readinto(buffer)
+                    chunk = view[:n]
+                else:
+                    chunk = src.read(UPLOAD_CHUNK_SIZE)
+                    n = len(chunk)
+                if not n:
+                    break
+
+                total_size += n
+
+                # Check file size limit
+                if total_size > self.max_size_bytes:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File too large. Maximum size: {self.settings.max_upload_size_mb}MB"
+                    )
+
+                dst.write(chunk)
+
+    def _copy_spooled_file(self, src, dest_path: Path) -> None:
+        """
+        Copy an on-disk spooled upload to dest_path (runs in a worker thread).
+
+        The size is known from fstat, so oversized files are rejected before
+        anything is written. Uses os.sendfile where available, otherwise
+        shutil.copyfileobj.
+
+        Args:
+            src: Rolled-over SpooledTemporaryFile backing the UploadFile
+            dest_path: Destination path for the saved upload
+
+        Raises:
+            HTTPException: If file size exceeds limit
+        """
+        src_fd = src.fileno()
+        offset = src.tell()
+        remaining = os.fstat(src_fd).st_size - offset
+
+        if remaining > self.max_size_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large. Maximum size: {self.settings.max_upload_size_mb}MB"
+            )
+
+        with open(dest_path, 'wb') as dst:
+            if hasattr(os, "sendfile"):
+                dst_fd = dst.fileno()
+                while remaining > 0:
+                    sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+            else:
+                shutil.copyfileobj(src, dst, UPLOAD_CHUNK_SIZE)
+
     def cleanup_file(self, file_path: Path | str) -> None:
         """
         Delete temporary file.
@@ -114,7 +224,19 @@ class FileHandler:
             Path(file_path).unlink(missing_ok=True)
         except Exception as e:
             # Log but don't raise - cleanup is best-effort
-            print(f"Warning: Could not delete temp file {file_path}: {e}")
+            logger.warning(f"Could not delete temp file {file_path}: {e}")
+
+    async def cleanup_file_async(self, file_path: Path | str) -> None:
+        """
+        Delete a temporary file without blocking the event loop.
+
+        Use from async request handlers; same best-effort semantics as
+        cleanup_file().
+
+        Args:
+            file_path: Path to file to delete (can be Path or string)
+        """
+        await asyncio.to_thread(self.cleanup_file, file_path)
 
     def get_file_size(self, file_path: Path | str) -> int:
         """
@@ -6,14 +6,43 @@ JWT token generation/validation and password hashing.
 Stub implementation for Phase 2, fully implemented in Phase 7.
 """
 
-from datetime import datetime, timedelta
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
-from jose import jwt, JWTError
+import jwt
 
 from config import get_settings
 
 
+# Settings and JWT parameters resolved once at import; rotating the secret
+# or changing token lifetimes requires a restart
+_SETTINGS = get_settings()
+_JWT_ALGORITHM = _SETTINGS.jwt_algorithm
+_ALGORITHMS = [_JWT_ALGORITHM]
+_ACCESS_TOKEN_EXPIRE_SECONDS = _SETTINGS.jwt_access_token_expire_minutes * 60
+_REFRESH_TOKEN_EXPIRE_SECONDS = _SETTINGS.jwt_refresh_token_expire_days * 86400
+
+
+# HMAC key as bytes, encoded once rather than on every encode/decode
+_SIGNING_KEY = _SETTINGS.jwt_secret_key.encode()
+
+
+# Decoded-token cache: hot tokens skip signature verification entirely.
+# Entries expire at min(token exp, now + TOKEN_CACHE_TTL_SECONDS) so a
+# cached payload never outlives the token itself.
+TOKEN_CACHE_MAX_SIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 5.0
+
+_token_cache: "OrderedDict[bytes, tuple[float, Dict[str, Any]]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
 def verify_token(token: str) -> Dict[str, Any]:
     """
     Verify and decode a JWT token.
@@ -25,19 +54,73 @@ def verify_token(token: str) -> Dict[str, Any]:
         dict: The decoded token payload
         
     Raises:
-        JWTError: If the token is invalid or expired
+        jwt.PyJWTError: If the token is invalid or expired
     """
-    settings = get_settings()
-    
     payload = jwt.decode(
         token,
-        settings.jwt_secret_key,
-        algorithms=[settings.jwt_algorithm]
+        _SIGNING_KEY,
+        algorithms=_ALGORITHMS
     )
     
     return payload
 
 
+def _token_cache_key(token: str) -> bytes:
+    """Hash the token so the cache never retains full JWT strings."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def verify_token_cached(token: str) -> Dict[str, Any]:
+    """
+    Verify a JWT token, reusing recently decoded payloads.
+    
+    Uses a bounded LRU cache keyed by a hash of the raw token. Each entry
+    lives for at most TOKEN_CACHE_TTL_SECONDS and never beyond the token's
+    own 'exp' claim.
+    
+    Args:
+        token: The JWT token string
+        
+    Returns:
+        dict: The decoded token payload
+        
+    Raises:
+        jwt.PyJWTError: If the token is invalid or expired
+    """
+    key = _token_cache_key(token)
+    now = time.time()
+    
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at > now:
+                _token_cache.move_to_end(key)
+                return payload
+            del _token_cache[key]
+    
+    payload = verify_token(token)
+    
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, float(exp))
+    
+    with _token_cache_lock:
+        _token_cache[key] = (expires_at, payload)
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+    
+    return payload
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token payloads (e.g. after rotating the secret)."""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
 def create_access_token(
     data: dict,
     expires_delta: Optional[timedelta] = None
@@ -52,23 +135,19 @@ def create_access_token(
     Returns:
         str: The encoded JWT token
     """
-    settings = get_settings()
-    
     to_encode = data.copy()
     
+    # 'exp' is a NumericDate - build the integer directly
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.jwt_access_token_expire_minutes
-        )
-    
+        expire = int(time.time()) + _ACCESS_TOKEN_EXPIRE_SECONDS
     to_encode.update({"exp": expire})
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm
+        _SIGNING_KEY,
+        algorithm=_JWT_ALGORITHM
     )
     
     return encoded_jwt
@@ -84,21 +163,49 @@ def create_refresh_token(data: dict) -> str:
     Returns:
         str: The encoded JWT refresh token
     """
-    settings = get_settings()
-    
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.jwt_refresh_token_expire_days)
+    expire = int(time.time()) + _REFRESH_TOKEN_EXPIRE_SECONDS
     to_encode.update({"exp": expire})
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm
+        _SIGNING_KEY,
+        algorithm=_JWT_ALGORITHM
     )
     
     return encoded_jwt
 
 
+@lru_cache(maxsize=1)
+def _get_pwd_context():
+    """
+    Get the password hashing context, built on first use.
+    
+    passlib/bcrypt are imported lazily so API workers that never hash a
+    password don't load them at boot. The context is built once and
+    reused; None if passlib isn't installed.
+    """
+    try:
+        from passlib.context import CryptContext
+    except ImportError:
+        return None
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+# Key for the passlib-less fallback hash. Derived from the JWT secret
+# because BLAKE2b keys are limited to 64 bytes.
+_PW_FALLBACK_KEY = hashlib.blake2b(
+    _SETTINGS.jwt_secret_key.encode(), digest_size=32
+).digest()
+
+
+def _fallback_hash(password: str) -> str:
+    """Keyed BLAKE2b password hash, used only when passlib is missing."""
+    return hashlib.blake2b(
+        password.encode(), key=_PW_FALLBACK_KEY, digest_size=32
+    ).hexdigest()
+
+
 # Password hashing stubs - will be fully implemented in Phase 7
 def hash_password(password: str) -> str:
     """
@@ -112,14 +219,11 @@ def hash_password(password: str) -> str:
     Returns:
         str: Hashed password
     """
-    try:
-        from passlib.context import CryptContext
-        pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    pwd_context = _get_pwd_context()
+    if pwd_context is not None:
         return pwd_context.hash(password)
-    except ImportError:
-        # Fallback if passlib not installed yet
-        import hashlib
-        return hashlib.sha256(password.encode()).hexdigest()
+    # Fallback if passlib not installed yet
+    return _fallback_hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -135,11 +239,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches
     """
-    try:
-        from passlib.context import CryptContext
-        pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    pwd_context = _get_pwd_context()
+    if pwd_context is not None:
         return pwd_context.verify(plain_password, hashed_password)
-    except ImportError:
-        # Fallback if passlib not installed yet
-        import hashlib
-        return hashlib.sha256(plain_password.encode()).hexdigest() == hashed_password
+    # Fallback if passlib not installed yet - constant-time comparison
+    return hmac.compare_digest(_fallback_hash(plain_password), hashed_password)
@@ -33,11 +33,15 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-from core.pipeline import MedicalDocumentationPipeline, save_result_to_file
-from models import ProcessingStatus
 from config import get_settings
+from models import ProcessingStatus
 from exceptions import MedScribeError
 
+try:
+    import orjson
+except ImportError:  # Only in requirements-api.txt; core-only installs may lack it
+    orjson = None
+
 
 # ANSI colors for terminal output
 class Colors:
@@ -52,14 +56,39 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Checked once at import instead of an isatty() syscall per print
+_IS_TTY = sys.stdout.isatty()
+
+
 def colorize(text: str, color: str) -> str:
     """Add color to text if terminal supports it."""
-    # Check if stdout is a terminal
-    if sys.stdout.isatty():
+    if _IS_TTY:
         return f"{color}{text}{Colors.ENDC}"
     return text
 
 
+# Colored "[  STATUS  ]" prefixes for progress updates, built once
+_STATUS_PREFIXES = {
+    status: colorize(f"[{status.value.upper():^12}]", color)
+    for status, color in (
+        (ProcessingStatus.PENDING, Colors.YELLOW),
+        (ProcessingStatus.TRANSCRIBING, Colors.BLUE),
+        (ProcessingStatus.GENERATING, Colors.CYAN),
+        (ProcessingStatus.COMPLETED, Colors.GREEN),
+        (ProcessingStatus.FAILED, Colors.RED),
+    )
+}
+
+
+def print_json(data) -> None:
+    """Print data as indented JSON (orjson when available, stdlib otherwise)."""
+    if orjson is not None:
+        print(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2).decode())
+    else:
+        import json
+        print(json.dumps(data, indent=2, default=str))
+
+
 def print_banner():
     """Print a nice banner for the CLI."""
     banner = """
@@ -197,18 +226,11 @@ def progress_callback(status: ProcessingStatus, message: str) -> None:
     
     This is called by the pipeline at each stage.
     """
-    status_colors = {
-        ProcessingStatus.PENDING: Colors.YELLOW,
-        ProcessingStatus.TRANSCRIBING: Colors.BLUE,
-        ProcessingStatus.GENERATING: Colors.CYAN,
-        ProcessingStatus.COMPLETED: Colors.GREEN,
-        ProcessingStatus.FAILED: Colors.RED,
-    }
-    
-    color = status_colors.get(status, Colors.ENDC)
-    status_str = f"[{status.value.upper():^12}]"
+    prefix = _STATUS_PREFIXES.get(status)
+    if prefix is None:
+        prefix = colorize(f"[{status.value.upper():^12}]", Colors.ENDC)
     
-    print(f"{colorize(status_str, color)} {message}")
+    print(f"{prefix} {message}")
 
 
 def main(args: Optional[list[str]] = None) -> int:
@@ -250,6 +272,10 @@ def main(args: Optional[list[str]] = None) -> int:
         # Build settings with any overrides
         settings = get_settings()
         
+        # Imported only once arguments are valid: core.pipeline pulls in
+        # Whisper/torch and LangChain, which takes seconds to load
+        from core.pipeline import MedicalDocumentationPipeline, save_result_to_file
+        
         # Create pipeline
         pipeline = MedicalDocumentationPipeline()
         
@@ -262,8 +288,7 @@ def main(args: Optional[list[str]] = None) -> int:
             soap_note = pipeline.generate_soap_only(parsed_args.text)
             
             if parsed_args.json:
-                import json
-                print(json.dumps(soap_note.model_dump(), indent=2))
+                print_json(soap_note.model_dump())
             else:
                 print(soap_note.to_formatted_string())
         
@@ -275,8 +300,7 @@ def main(args: Optional[list[str]] = None) -> int:
             result = pipeline.transcribe_only(parsed_args.audio_file)
             
             if parsed_args.json:
-                import json
-                print(json.dumps(result.model_dump(), indent=2))
+                print_json(result.model_dump())
             else:
                 print(colorize("\n─── TRANSCRIPTION ───\n", Colors.HEADER))
                 print(result.text)
@@ -290,8 +314,7 @@ def main(args: Optional[list[str]] = None) -> int:
             soap_note = pipeline.generate_soap_only(parsed_args.text)
             
             if parsed_args.json:
-                import json
-                print(json.dumps(soap_note.model_dump(), indent=2))
+                print_json(soap_note.model_dump())
             else:
                 print(soap_note.to_formatted_string())
         
@@ -315,8 +338,7 @@ def main(args: Optional[list[str]] = None) -> int:
             
             # Output results
             if parsed_args.json:
-                import json
-                print(json.dumps(result.model_dump(mode='json'), indent=2, default=str))
+                print_json(result.model_dump(mode='json'))
             else:
                 print(result.soap_note.to_formatted_string())
             
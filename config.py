@@ -16,10 +16,161 @@ We use a cached function to ensure we only load settings once,
 but still allow for easy testing with different configurations.
 """
 
-from functools import lru_cache
-from typing import Optional
-from pydantic_settings import BaseSettings
-from pydantic import Field
+import os
+import re
+import tempfile
+
+# Pydantic validates every core schema it generates against its own
+# meta-schema; our models are fixed, so that is pure startup cost.
+# This must run before any pydantic model is defined, so import config
+# ahead of other pydantic-using modules. Pydantic only checks whether the
+# variable exists: to keep schema validation (e.g. in CI), set
+# MedScribe_VALIDATE_CORE_SCHEMAS to a true value (1/true/yes/on) in the
+# environment.
+if os.environ.get("MedScribe_VALIDATE_CORE_SCHEMAS", "").strip().lower() not in (
+    "1", "true", "yes", "on"
+):
+    os.environ.setdefault("PYDANTIC_SKIP_VALIDATING_CORE_SCHEMAS", "true")
+
+from abc import ABC, abstractmethod
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Annotated, Any, Literal
+from annotated_types import Interval
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
+
+
+# A quoted .env value at the start of the right-hand side; anything after
+# the closing quote (e.g. a trailing comment) is ignored
+_QUOTED_ENV_VALUE_RE = re.compile(r'"((?:[^"\\]|\\.)*)"|\'([^\']*)\'')
+_ENV_ESCAPE_RE = re.compile(r'\\(.)')
+_ENV_ESCAPES = {"n": "\n", "r": "\r", "t": "\t"}
+
+
+def _parse_env_value(value: str) -> str:
+    """
+    Unquote a .env value and drop its trailing comment.
+    
+    Double-quoted values support backslash escapes (an escaped quote or
+    backslash, and n/t/r); single-quoted values are taken literally. In
+    unquoted values a ' #' starts a comment.
+    """
+    match = _QUOTED_ENV_VALUE_RE.match(value)
+    if match is None:
+        return value.split(" #", 1)[0].rstrip()
+    if match.group(2) is not None:
+        return match.group(2)
+    return _ENV_ESCAPE_RE.sub(
+        lambda m: _ENV_ESCAPES.get(m.group(1), m.group(1)), match.group(1)
+    )
+
+
+@lru_cache(maxsize=1)
+def _read_env_file(path: str, mtime: float) -> dict[str, str]:
+    """
+    Parse a .env file into lowercased keys (cached for the last path and mtime).
+    
+    Supports the subset of dotenv syntax the project uses: KEY=value
+    lines, optional 'export ' prefix, '#' comments (including after a
+    value), and single- or double-quoted values. Rebuilding Settings (after
+    get_settings.cache_clear()) reuses the parsed file until it changes
+    on disk.
+    """
+    env_vars: dict[str, str] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            if line.startswith("export "):
+                line = line[7:]
+            
+            key, value = line.split("=", 1)
+            env_vars[key.strip().lower()] = _parse_env_value(value.strip())
+    return env_vars
+
+
+class _PrefixedMappingSource(PydanticBaseSettingsSource, ABC):
+    """
+    Resolve settings fields from a lowercased {env name: value} mapping.
+    
+    Subclasses provide the mapping; each field is then a single dict
+    lookup on "<env_prefix><field_name>".
+    """
+    
+    @abstractmethod
+    def _env_vars(self) -> dict[str, str]:
+        """Lowercased {env name: value} mapping to resolve fields from."""
+    
+    def get_field_value(self, field, field_name):
+        # Unused: __call__ resolves all fields from the mapping at once
+        return None, field_name, False
+    
+    def __call__(self) -> dict[str, Any]:
+        env_vars = self._env_vars()
+        if not env_vars:
+            return {}
+        prefix = self.config.get("env_prefix", "").lower()
+        
+        data: dict[str, Any] = {}
+        for field_name, field in self.settings_cls.model_fields.items():
+            value = env_vars.get(f"{prefix}{field_name}")
+            if value is None:
+                continue
+            if self.field_is_complex(field):
+                value = self.decode_complex_value(field_name, field, value)
+            data[field_name] = value
+        return data
+
+
+class _EnvSnapshotSource(_PrefixedMappingSource):
+    """
+    Settings source reading os.environ in one pass.
+    
+    Only variables carrying the env prefix are kept (lowercased), so a
+    large container environment is scanned once and never per field.
+    """
+    
+    def _env_vars(self) -> dict[str, str]:
+        prefix = self.config.get("env_prefix", "").lower()
+        env_vars = {}
+        for key, value in os.environ.items():
+            key = key.lower()
+            if key.startswith(prefix):
+                env_vars[key] = value
+        return env_vars
+
+
+class _CachedDotEnvSource(_PrefixedMappingSource):
+    """
+    Settings source reading the model's env_file through _read_env_file.
+    
+    Like the built-in dotenv source, prefixed keys that match no field are
+    passed through under extra="forbid", so a typo such as
+    MedScribe_OLAMA_MODEL fails validation instead of being dropped.
+    """
+    
+    def __call__(self) -> dict[str, Any]:
+        data = super().__call__()
+        if self.config.get("extra") != "forbid":
+            return data
+        
+        prefix = self.config.get("env_prefix", "").lower()
+        fields = self.settings_cls.model_fields
+        for key, value in self._env_vars().items():
+            if key.startswith(prefix) and key[len(prefix):] not in fields:
+                data[key] = value
+        return data
+    
+    def _env_vars(self) -> dict[str, str]:
+        env_file = self.config.get("env_file")
+        if not env_file:
+            return {}
+        try:
+            mtime = os.stat(env_file).st_mtime
+        except OSError:
+            return {}
+        return _read_env_file(str(env_file), mtime)
 
 
 class Settings(BaseSettings):
@@ -38,432 +189,442 @@ class Settings(BaseSettings):
     # =================================================================
     # Whisper Configuration
     # =================================================================
-    whisper_model: str = Field(
-        default="base",
-        description="""
-        Whisper model size. Options: tiny, base, small, medium, large
-        
-        Trade-offs:
-        - tiny: Fastest, least accurate, ~1GB VRAM
-        - base: Good balance for development, ~1GB VRAM  
-        - small: Better accuracy, ~2GB VRAM
-        - medium: High accuracy, ~5GB VRAM
-        - large: Best accuracy, ~10GB VRAM
-        
-        For medical transcription, recommend 'small' or higher in production.
-        """
-    )
-    
-    whisper_device: str = Field(
-        default="cpu",
-        description="Device for Whisper: 'cpu', 'cuda', or 'auto'"
-    )
-    
-    whisper_language: Optional[str] = Field(
-        default=None,
-        description="Force language detection. None = auto-detect"
-    )
+    whisper_model: str = "base"
+    whisper_device: str = "cpu"
+    whisper_language: str | None = None
 
     # =================================================================
     # Speaker Diarization Configuration (Phase 1)
     # =================================================================
-    enable_diarization: bool = Field(
-        default=True,
-        description="""
-        Enable speaker diarization to identify 'who spoke when'.
-
-        HIGHLY RECOMMENDED for medical consultations to prevent LLM
-        hallucinations where doctor is misidentified as having symptoms.
-        """
-    )
-
-    diarization_model: str = Field(
-        default="pyannote/speaker-diarization-3.1",
-        description="Pyannote model for speaker diarization"
-    )
-
-    diarization_min_speakers: Optional[int] = Field(
-        default=2,
-        description="Minimum number of speakers (None = auto-detect)"
-    )
-
-    diarization_max_speakers: Optional[int] = Field(
-        default=2,
-        description="Maximum number of speakers (None = auto-detect)"
-    )
-
-    diarization_device: str = Field(
-        default="cpu",
-        description="Device for diarization: 'cpu' or 'cuda'"
-    )
-
-    huggingface_token: Optional[str] = Field(
-        default=None,
-        description="""
-        HuggingFace authentication token for Pyannote models.
-        Get token at: https://huggingface.co/settings/tokens
-        Accept license at: https://huggingface.co/pyannote/speaker-diarization-3.1
-
-        Set via MedScribe_HUGGINGFACE_TOKEN environment variable.
-        """
-    )
-
-    auto_label_speakers: bool = Field(
-        default=True,
-        description="""
-        Automatically label speakers as Doctor/Patient based on speaking time.
-
-        Heuristic: Speaker who talks more = Doctor
-        Disable if you want to manually configure speaker roles.
-        """
-    )
+    enable_diarization: bool = True
+    diarization_model: str = "pyannote/speaker-diarization-3.1"
+    diarization_min_speakers: int | None = 2
+    diarization_max_speakers: int | None = 2
+    diarization_device: str = "cpu"
+    huggingface_token: str | None = None
+    auto_label_speakers: bool = True
 
     # =================================================================
     # Ollama Configuration
     # =================================================================
-    ollama_base_url: str = Field(
-        default="http://localhost:11434",
-        description="Ollama server URL. Default is local installation."
-    )
-    
-    ollama_model: str = Field(
-        default="llama3.2",
-        description="""
-        Ollama model for SOAP generation. Recommended models:
-        
-        - llama3.2: Good balance of speed and quality (8B params)
-        - llama3.2:70b: Higher quality, needs more resources
-        - mistral: Fast, good for structured output
-        - mixtral: High quality, slower
-        
-        For medical use, larger models generally perform better with
-        medical terminology and reasoning.
-        """
-    )
-    
-    ollama_temperature: float = Field(
-        default=0.3,
-        ge=0.0,
-        le=2.0,
-        description="""
-        Temperature for text generation (0.0 - 2.0)
-        
-        - 0.0-0.3: More deterministic, consistent output (recommended for medical)
-        - 0.4-0.7: Balanced creativity and consistency
-        - 0.8+: More creative, less predictable
-        
-        For medical documentation, lower is better for consistency.
-        """
-    )
-    
-    ollama_timeout: int = Field(
-        default=120,
-        description="Timeout in seconds for Ollama requests"
-    )
+    ollama_base_url: str = "http://localhost:11434"
+    ollama_model: str = "llama3.2"
+    ollama_temperature: Annotated[float, Interval(ge=0.0, le=2.0)] = 0.3
+    ollama_timeout: int = 120
+    ollama_context_window: int = 4096
+    ollama_context_window_max: int = 32768
+    ollama_keep_alive: str = "30m"
+    skip_connection_test: bool = False
 
-    ollama_context_window: int = Field(
-        default=4096,
-        description="Context window size for Ollama model (tokens)"
-    )
+    # =================================================================
+    # LLM Backend Selection
+    # =================================================================
+    llm_backend: Literal["ollama", "vllm"] = "ollama"
+    vllm_base_url: str = "http://localhost:8000/v1"
+    vllm_model: str = "meta-llama/Llama-3.2-3B-Instruct"
+    vllm_max_tokens: int = 2048
 
     # =================================================================
     # Processing Configuration
     # =================================================================
-    max_audio_duration_seconds: int = Field(
-        default=1800,  # 30 minutes
-        description="Maximum audio duration to process (prevents resource exhaustion)"
-    )
-    
-    supported_audio_formats: list[str] = Field(
-        default=["mp3", "wav", "m4a", "ogg", "flac", "webm"],
-        description="List of supported audio file extensions"
-    )
+    max_audio_duration_seconds: int = 1800  # 30 minutes
+    supported_audio_formats: frozenset[str] = frozenset({"mp3", "wav", "m4a", "ogg", "flac", "webm"})
 
     # =================================================================
     # Context Window Management (Phase 5 - Map-Reduce)
     # =================================================================
-    enable_map_reduce: bool = Field(
-        default=True,
-        description="""
-        Enable Map-Reduce strategy for long transcripts.
-
-        When transcript exceeds context window, split into chunks,
-        summarize each, then synthesize final SOAP note.
-        """
-    )
-
-    map_reduce_chunk_size: int = Field(
-        default=3000,
-        description="""
-        Chunk size in tokens for Map-Reduce strategy.
-
-        Should be smaller than context window to allow for prompt overhead.
-        """
-    )
-
-    map_reduce_overlap: int = Field(
-        default=200,
-        description="Token overlap between chunks to preserve context"
-    )
+    enable_map_reduce: bool = True
+    map_reduce_chunk_size: int = 3000
+    map_reduce_overlap: int = 200
 
     # =================================================================
     # Output Configuration
     # =================================================================
-    output_dir: str = Field(
-        default="./output",
-        description="Directory for output files"
-    )
-    
-    save_transcriptions: bool = Field(
-        default=True,
-        description="Whether to save intermediate transcriptions"
-    )
+    output_dir: str = "./output"
+    save_transcriptions: bool = True
 
     # =================================================================
     # HIPAA Compliance & Security (Phase 6)
     # =================================================================
-    enable_encryption: bool = Field(
-        default=True,
-        description="""
-        Enable AES-256 encryption for all saved audio and transcripts.
-
-        REQUIRED for HIPAA compliance when storing PHI (Protected Health Information).
-        2025 HIPAA mandates encryption at rest (no longer "addressable").
-        """
-    )
-
-    encryption_key_path: Optional[str] = Field(
-        default=None,
-        description="""
-        Path to encryption key file.
-
-        If None, generates ephemeral key (lost after process exit).
-        For production, use persistent key stored securely (HSM recommended).
-        """
-    )
-
-    enable_audit_logging: bool = Field(
-        default=True,
-        description="""
-        Enable HIPAA-compliant audit logging.
-
-        Logs: user, timestamp, file accessed, action taken.
-        Required for HIPAA compliance (45 CFR § 164.312(b)).
-        """
-    )
-
-    audit_log_path: str = Field(
-        default="./audit.log",
-        description="Path to audit log file (encrypted)"
-    )
-
-    secure_temp_directory: bool = Field(
-        default=True,
-        description="""
-        Use encrypted temporary directory for processing.
-
-        Ensures no plaintext PHI in temp files.
-        Automatic cleanup after processing.
-        """
-    )
+    enable_encryption: bool = True
+    encryption_key_path: str | None = None
+    enable_audit_logging: bool = True
+    audit_log_path: str = "./audit.log"
+    secure_temp_directory: bool = True
 
     # =================================================================
     # Clinical Coding (Phase 2)
     # =================================================================
-    enable_clinical_coding: bool = Field(
-        default=True,
-        description="""
-        Enable ICD-10 and CPT code suggestions in SOAP notes.
-
-        Helps with billing and medical terminology standardization.
-        """
-    )
-
-    coding_confidence_threshold: float = Field(
-        default=0.7,
-        ge=0.0,
-        le=1.0,
-        description="""
-        Minimum confidence score to include AI-suggested codes.
-
-        Codes below this threshold are omitted (reduce false positives).
-        """
-    )
+    enable_clinical_coding: bool = True
+    coding_confidence_threshold: Annotated[float, Interval(ge=0.0, le=1.0)] = 0.7
 
     # =================================================================
     # Logging Configuration
     # =================================================================
-    log_level: str = Field(
-        default="INFO",
-        description="Logging level: DEBUG, INFO, WARNING, ERROR, CRITICAL"
-    )
-    
-    log_format: str = Field(
-        default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        description="Python logging format string"
-    )
+    log_level: str = "INFO"
+    log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     # =================================================================
     # API Configuration (Phase 2)
     # =================================================================
-    api_host: str = Field(
-        default="0.0.0.0",
-        description="Host to bind the API server"
-    )
-    
-    api_port: int = Field(
-        default=8000,
-        description="Port for the API server"
-    )
-    
-    api_workers: int = Field(
-        default=4,
-        description="Number of API worker processes"
-    )
-    
-    api_debug: bool = Field(
-        default=False,
-        description="Enable debug mode for API (exposes error details)"
-    )
+    api_host: str = "0.0.0.0"
+    api_port: int = 8000
+    api_workers: int = 4
+    api_debug: bool = False
+    reload_env_file: bool = False
 
     # =================================================================
     # Security / JWT Configuration
     # =================================================================
-    jwt_secret_key: str = Field(
-        default="change-me-in-production-use-strong-random-key",
-        description="Secret key for JWT token signing. CHANGE IN PRODUCTION!"
-    )
-    
-    jwt_algorithm: str = Field(
-        default="HS256",
-        description="Algorithm for JWT token signing"
-    )
-    
-    jwt_access_token_expire_minutes: int = Field(
-        default=30,
-        description="Access token expiration time in minutes"
-    )
-    
-    jwt_refresh_token_expire_days: int = Field(
-        default=7,
-        description="Refresh token expiration time in days"
-    )
+    jwt_secret_key: str = "change-me-in-production-use-strong-random-key"
+    jwt_algorithm: str = "HS256"
+    jwt_access_token_expire_minutes: int = 30
+    jwt_refresh_token_expire_days: int = 7
 
     # =================================================================
     # CORS Configuration
     # =================================================================
-    cors_origins: list = Field(
-        default=["http://localhost:3000", "http://localhost:8000"],
-        description="Allowed CORS origins"
-    )
-    
-    cors_allow_credentials: bool = Field(
-        default=True,
-        description="Allow credentials in CORS requests"
-    )
+    cors_origins: tuple[str, ...] = ("http://localhost:3000", "http://localhost:8000")
+    cors_allow_credentials: bool = True
 
     # =================================================================
     # Redis Configuration
     # =================================================================
-    redis_host: str = Field(
-        default="localhost",
-        description="Redis server hostname"
-    )
-    
-    redis_port: int = Field(
-        default=6379,
-        description="Redis server port"
-    )
-    
-    redis_db: int = Field(
-        default=0,
-        description="Redis database number"
-    )
-    
-    redis_password: str = Field(
-        default="",
-        description="Redis password (empty for no auth)"
-    )
+    redis_host: str = "localhost"
+    redis_port: int = 6379
+    redis_db: int = 0
+    redis_password: str = ""
 
     # =================================================================
     # Celery Configuration
     # =================================================================
-    celery_broker_url: str = Field(
-        default="redis://localhost:6379/0",
-        description="Celery broker URL"
-    )
-    
-    celery_result_backend: str = Field(
-        default="redis://localhost:6379/0",
-        description="Celery result backend URL"
-    )
+    celery_broker_url: str = "redis://localhost:6379/0"
+    celery_result_backend: str = "redis://localhost:6379/0"
 
     # =================================================================
     # Rate Limiting
     # =================================================================
-    rate_limit_per_minute: int = Field(
-        default=60,
-        description="Rate limit per minute for unauthenticated requests"
-    )
-    
-    rate_limit_authenticated: int = Field(
-        default=120,
-        description="Rate limit per minute for authenticated requests"
-    )
+    rate_limit_per_minute: int = 60
+    rate_limit_authenticated: int = 120
 
     # =================================================================
     # File Upload Configuration
     # =================================================================
-    max_upload_size_mb: int = Field(
-        default=100,
-        description="Maximum file upload size in MB"
-    )
-    
-    allowed_audio_formats: list = Field(
-        default=[".mp3", ".wav", ".m4a", ".flac"],
-        description="Allowed audio file extensions for upload"
-    )
-    
-    temp_file_dir: str = Field(
-        default="/tmp/MedScribe",
-        description="Temporary directory for uploaded files"
-    )
-    
-    class Config:
-        """Pydantic configuration for Settings."""
-        env_prefix = "MedScribe_"  # All env vars start with MedScribe_
-        env_file = ".env"  # Load from .env file if present
-        env_file_encoding = "utf-8"
-        case_sensitive = False  # MedScribe_WHISPER_MODEL = MedScribe_whisper_model
+    max_upload_size_mb: int = 100
+    allowed_audio_formats: tuple[str, ...] = (".mp3", ".wav", ".m4a", ".flac")
+    temp_file_dir: str = "/tmp/MedScribe"
+    
+    model_config = SettingsConfigDict(
+        env_prefix="MedScribe_",  # All env vars start with MedScribe_
+        env_file=".env",  # Load from .env file if present
+        env_file_encoding="utf-8",
+        case_sensitive=False,  # MedScribe_WHISPER_MODEL = MedScribe_whisper_model
+        # Settings are read-only after load; also lets instances be hashed
+        frozen=True,
+        extra="forbid",
+        # Build the validator on first instantiation (get_settings) rather
+        # than at import of this module
+        defer_build=True,
+    )
+    
+    @cached_property
+    def supported_audio_formats_list(self) -> list[str]:
+        """Supported formats as a sorted list (error messages, JSON output)."""
+        return sorted(self.supported_audio_formats)
+    
+    @cached_property
+    def ollama_tags_url(self) -> str:
+        """Ollama model-listing endpoint (used by health checks)."""
+        return f"{self.ollama_base_url.rstrip('/')}/api/tags"
+    
+    @cached_property
+    def vllm_health_url(self) -> str:
+        """vLLM liveness endpoint (served at the root, not under /v1)."""
+        base = self.vllm_base_url.rstrip('/')
+        if base.endswith('/v1'):
+            base = base[:-3]
+        return f"{base}/health"
+    
+    @cached_property
+    def temp_path(self) -> Path:
+        """Upload temp directory as a Path (system temp dir if unset)."""
+        return Path(self.temp_file_dir or tempfile.gettempdir())
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls,
+        init_settings,
+        env_settings,
+        dotenv_settings,
+        file_secret_settings,
+    ):
+        """Same source priority as the default, with single-pass readers."""
+        return (
+            init_settings,
+            _EnvSnapshotSource(settings_cls),
+            _CachedDotEnvSource(settings_cls),
+            file_secret_settings,
+        )
+
+
+# =====================================================================
+# Field documentation
+# =====================================================================
+# Kept out of the Settings fields so the generated core schema carries no
+# description metadata; bounds use plain annotated_types constraints.
+FIELD_DOCS: dict[str, str] = {
+    "whisper_model": """
+        Whisper model size. Options: tiny, base, small, medium, large
+
+        Trade-offs:
+        - tiny: Fastest, least accurate, ~1GB VRAM
+        - base: Good balance for development, ~1GB VRAM
+        - small: Better accuracy, ~2GB VRAM
+        - medium: High accuracy, ~5GB VRAM
+        - large: Best accuracy, ~10GB VRAM
+
+        For medical transcription, recommend 'small' or higher in production.
+    """,
+    "whisper_device": "Device for Whisper: 'cpu', 'cuda', or 'auto'",
+    "whisper_language": "Force language detection. None = auto-detect",
+    "enable_diarization": """
+        Enable speaker diarization to identify 'who spoke when'.
+
+        HIGHLY RECOMMENDED for medical consultations to prevent LLM
+        hallucinations where doctor is misidentified as having symptoms.
+    """,
+    "diarization_model": "Pyannote model for speaker diarization",
+    "diarization_min_speakers": "Minimum number of speakers (None = auto-detect)",
+    "diarization_max_speakers": "Maximum number of speakers (None = auto-detect)",
+    "diarization_device": "Device for diarization: 'cpu' or 'cuda'",
+    "huggingface_token": """
+        HuggingFace authentication token for Pyannote models.
+        Get token at: https://huggingface.co/settings/tokens
+        Accept license at: https://huggingface.co/pyannote/speaker-diarization-3.1
+
+        Set via MedScribe_HUGGINGFACE_TOKEN environment variable.
+    """,
+    "auto_label_speakers": """
+        Automatically label speakers as Doctor/Patient based on speaking time.
+
+        Heuristic: Speaker who talks more = Doctor
+        Disable if you want to manually configure speaker roles.
+    """,
+    "ollama_base_url": "Ollama server URL. Default is local installation.",
+    "ollama_model": """
+        Ollama model for SOAP generation. Recommended models:
+
+        - llama3.2: Good balance of speed and quality (8B params)
+        - llama3.2:70b: Higher quality, needs more resources
+        - mistral: Fast, good for structured output
+        - mixtral: High quality, slower
+
+        For medical use, larger models generally perform better with
+        medical terminology and reasoning.
+
+        Ollama library tags are 4-bit quantized (q4_K_M) by default, which
+        keeps decoding fast. Use an explicit tag to trade speed for accuracy,
+        e.g. llama3.2:3b-instruct-q8_0.
+    """,
+    "ollama_temperature": """
+        Temperature for text generation (0.0 - 2.0)
+
+        - 0.0-0.3: More deterministic, consistent output (recommended for medical)
+        - 0.4-0.7: Balanced creativity and consistency
+        - 0.8+: More creative, less predictable
+
+        For medical documentation, lower is better for consistency.
+    """,
+    "ollama_timeout": "Timeout in seconds for Ollama requests",
+    "ollama_context_window": """
+        Smallest context window for the Ollama model (tokens). Each request
+        doubles it as needed to fit the prompt (the few-shot prompt alone is
+        ~12K tokens), up to ollama_context_window_max.
+    """,
+    "ollama_context_window_max": """
+        Largest context window used for a request (tokens). Must fit in
+        memory next to the model; prompts beyond it are truncated by Ollama.
+    """,
+    "ollama_keep_alive": """
+        How long Ollama keeps the model loaded after a request (e.g. "30m",
+        "-1" for forever). While loaded, its KV cache still holds the shared
+        few-shot prompt prefix, so the next note skips most of the prefill.
+    """,
+    "skip_connection_test": """
+        Skip the LLM server check (model listing / health endpoint) when the
+        SOAP generator first connects. Saves one HTTP round trip on cold
+        start; connection problems then surface on the first generation.
+    """,
+    "llm_backend": """
+        LLM serving backend for SOAP generation.
+
+        - ollama: Local Ollama server (default). Requests are served one
+          at a time, so concurrent notes queue behind each other.
+        - vllm: vLLM's OpenAI-compatible server. Continuous batching lets
+          concurrent SOAP requests share forward passes. Start it with:
+          vllm serve <model> --max-model-len 32768 --max-num-batched-tokens 4096 \\
+              --enable-prefix-caching
+          Prefix caching lets every request reuse the KV cache of the shared
+          system + few-shot prompt.
+    """,
+    "vllm_base_url": "vLLM OpenAI-compatible API URL (including the /v1 suffix)",
+    "vllm_model": "Model name as served by vLLM (the argument to 'vllm serve')",
+    "vllm_max_tokens": "Maximum tokens vLLM may generate per SOAP note",
+    "max_audio_duration_seconds": "Maximum audio duration to process (prevents resource exhaustion)",
+    "supported_audio_formats": "Set of supported audio file extensions (without the dot)",
+    "enable_map_reduce": """
+        Enable Map-Reduce strategy for long transcripts.
+
+        When transcript exceeds context window, split into chunks,
+        summarize each, then synthesize final SOAP note.
+    """,
+    "map_reduce_chunk_size": """
+        Chunk size in tokens for Map-Reduce strategy.
+
+        Should be smaller than context window to allow for prompt overhead.
+    """,
+    "map_reduce_overlap": "Token overlap between chunks to preserve context",
+    "output_dir": "Directory for output files",
+    "save_transcriptions": "Whether to save intermediate transcriptions",
+    "enable_encryption": """
+        Enable AES-256 encryption for all saved audio and transcripts.
+
+        REQUIRED for HIPAA compliance when storing PHI (Protected Health Information).
+        2025 HIPAA mandates encryption at rest (no longer "addressable").
+    """,
+    "encryption_key_path": """
+        Path to encryption key file.
+
+        If None, generates ephemeral key (lost after process exit).
+        For production, use persistent key stored securely (HSM recommended).
+    """,
+    "enable_audit_logging": """
+        Enable HIPAA-compliant audit logging.
+
+        Logs: user, timestamp, file accessed, action taken.
+        Required for HIPAA compliance (45 CFR § 164.312(b)).
+    """,
+    "audit_log_path": "Path to audit log file (encrypted)",
+    "secure_temp_directory": """
+        Use encrypted temporary directory for processing.
+
+        Ensures no plaintext PHI in temp files.
+        Automatic cleanup after processing.
+    """,
+    "enable_clinical_coding": """
+        Enable ICD-10 and CPT code suggestions in SOAP notes.
+
+        Helps with billing and medical terminology standardization.
+    """,
+    "coding_confidence_threshold": """
+        Minimum confidence score to include AI-suggested codes.
+
+        Codes below this threshold are omitted (reduce false positives).
+    """,
+    "log_level": "Logging level: DEBUG, INFO, WARNING, ERROR, CRITICAL",
+    "log_format": "Python logging format string",
+    "api_host": "Host to bind the API server",
+    "api_port": "Port for the API server",
+    "api_workers": "Number of API worker processes",
+    "api_debug": "Enable debug mode for API (exposes error details)",
+    "reload_env_file": """
+        Reload settings when the .env file changes on disk (development).
+
+        Only code calling get_settings() sees the new values; modules that
+        read settings at import keep theirs until restart.
+    """,
+    "jwt_secret_key": "Secret key for JWT token signing. CHANGE IN PRODUCTION!",
+    "jwt_algorithm": "Algorithm for JWT token signing",
+    "jwt_access_token_expire_minutes": "Access token expiration time in minutes",
+    "jwt_refresh_token_expire_days": "Refresh token expiration time in days",
+    "cors_origins": "Allowed CORS origins",
+    "cors_allow_credentials": "Allow credentials in CORS requests",
+    "redis_host": "Redis server hostname",
+    "redis_port": "Redis server port",
+    "redis_db": "Redis database number",
+    "redis_password": "Redis password (empty for no auth)",
+    "celery_broker_url": "Celery broker URL",
+    "celery_result_backend": "Celery result backend URL",
+    "rate_limit_per_minute": "Rate limit per minute for unauthenticated requests",
+    "rate_limit_authenticated": "Rate limit per minute for authenticated requests",
+    "max_upload_size_mb": "Maximum file upload size in MB",
+    "allowed_audio_formats": "Allowed audio file extensions for upload",
+    "temp_file_dir": "Temporary directory for uploaded files",
+}
+
+
+# Process-wide settings instance, created on first get_settings() call,
+# and the .env mtime it was loaded from (None if there is no .env file)
+_SETTINGS: Settings | None = None
+_SETTINGS_ENV_MTIME: float | None = None
+
+
+def _env_file_mtime() -> float | None:
+    """Modification time of the settings .env file, or None if absent."""
+    env_file = Settings.model_config.get("env_file")
+    if not env_file:
+        return None
+    try:
+        return os.stat(env_file).st_mtime
+    except OSError:
+        return None
 
 
-@lru_cache()
 def get_settings() -> Settings:
     """
     Get application settings (cached singleton).
     
-    Using lru_cache ensures we only parse environment variables once.
-    This is important because:
+    A module-level instance ensures we only parse environment variables
+    once. This is important because:
     1. Parsing is relatively slow
     2. Settings should be consistent throughout app lifecycle
     3. Reduces memory usage
     
+    With reload_env_file enabled (development), each call also checks the
+    .env file's mtime and reloads the settings if it changed. Otherwise
+    no stat() is done after the first load.
+    
     For testing, you can clear the cache:
         get_settings.cache_clear()
     
     Returns:
         Settings: Application settings instance
     """
-    return Settings()
+    global _SETTINGS, _SETTINGS_ENV_MTIME
+    if _SETTINGS is None:
+        _SETTINGS_ENV_MTIME = _env_file_mtime()
+        _SETTINGS = Settings()
+    elif _SETTINGS.reload_env_file:
+        mtime = _env_file_mtime()
+        if mtime != _SETTINGS_ENV_MTIME:
+            _SETTINGS_ENV_MTIME = mtime
+            _SETTINGS = Settings()
+    return _SETTINGS
+
 
+def _clear_settings_cache() -> None:
+    """Drop the cached settings so the next get_settings() reloads them."""
+    global _SETTINGS
+    _SETTINGS = None
 
-def get_settings_for_testing(**overrides) -> Settings:
+
+# Same API as the previous functools.lru_cache wrapper
+get_settings.cache_clear = _clear_settings_cache
+
+
+def get_settings_for_testing(validate: bool = False, **overrides) -> Settings:
     """
     Create a Settings instance with custom values for testing.
     
     This factory function allows tests to easily create Settings
     with specific values without affecting the global settings.
     
+    The overrides are applied to a copy of the already validated
+    application settings, so the environment and .env are not re-read.
+    By default the overrides are trusted and not validated; pass
+    validate=True for tests that exercise Settings validation itself.
+    
     Example:
         settings = get_settings_for_testing(
             whisper_model="tiny",
@@ -471,9 +632,25 @@ def get_settings_for_testing(**overrides) -> Settings:
         )
     
     Args:
+        validate: Validate the resulting settings (bounds, types)
         **overrides: Setting values to override
         
     Returns:
         Settings: New Settings instance with overrides applied
     """
-    return Settings(**overrides)
+    settings = get_settings().model_copy(update=overrides)
+    if validate:
+        return Settings.model_validate(settings.model_dump())
+    
+    # model_copy() also copies cached_property values; drop them so they
+    # are recomputed from the overridden fields
+    for name in _CACHED_PROPERTIES:
+        settings.__dict__.pop(name, None)
+    return settings
+
+
+# Names of Settings' cached_property attributes
+_CACHED_PROPERTIES = tuple(
+    name for name, attr in vars(Settings).items()
+    if isinstance(attr, cached_property)
+)
@@ -8,18 +8,35 @@ Contains the main pipeline and processing components for MedScribe AI:
 - speaker_diarizer: Speaker identification
 - soap_generator: SOAP note generation with LLM
 - prompts: LLM prompt templates
+
+Exports are resolved lazily (PEP 562): importing one submodule, e.g.
+``core.soap_generator``, no longer loads Whisper/torch and pyannote
+through this package's __init__.
 """
 
-from core.pipeline import MedicalDocumentationPipeline, create_pipeline, save_result_to_file
-from core.soap_generator import OllamaSOAPGenerator, create_soap_generator
-from core.transcriber import WhisperTranscriber, create_transcriber
-from core.speaker_diarizer import PyannnoteSpeakerDiarizer, create_speaker_diarizer, merge_diarization_with_transcription
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'MedicalDocumentationPipeline': 'core.pipeline',
+    'create_pipeline': 'core.pipeline',
+    'save_result_to_file': 'core.pipeline',
+    'OllamaSOAPGenerator': 'core.soap_generator',
+    'VLLMSOAPGenerator': 'core.soap_generator',
+    'create_soap_generator': 'core.soap_generator',
+    'WhisperTranscriber': 'core.transcriber',
+    'create_transcriber': 'core.transcriber',
+    'PyannnoteSpeakerDiarizer': 'core.speaker_diarizer',
+    'create_speaker_diarizer': 'core.speaker_diarizer',
+    'merge_diarization_with_transcription': 'core.speaker_diarizer',
+}
 
 __all__ = [
     'MedicalDocumentationPipeline',
     'create_pipeline',
     'save_result_to_file',
     'OllamaSOAPGenerator',
+    'VLLMSOAPGenerator',
     'create_soap_generator',
     'WhisperTranscriber',
     'create_transcriber',
@@ -27,3 +44,17 @@ __all__ = [
     'create_speaker_diarizer',
     'merge_diarization_with_transcription',
 ]
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access and cache it."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -46,6 +46,7 @@ from core.transcriber import (
 from core.soap_generator import (
     SOAPGeneratorProtocol,
     OllamaSOAPGenerator,
+    SectionCallback,
     create_soap_generator,
 )
 from exceptions import MedScribeError
@@ -697,14 +698,23 @@ class MedicalDocumentationPipeline:
         logger.info(f"Async transcribe-only mode for: {audio_path}")
         return await self.transcriber.atranscribe(audio_path)
 
-    async def agenerate_soap_only(self, transcription: str, language: str = "en") -> SOAPNote:
+    async def agenerate_soap_only(
+        self,
+        transcription: str,
+        language: str = "en",
+        on_section: Optional[SectionCallback] = None
+    ) -> SOAPNote:
         """
         Async version of generate_soap_only().
 
-        Generate SOAP note from existing transcription.
+        Generate SOAP note from existing transcription. With on_section, the
+        LLM response is streamed and each SOAP section is passed to the
+        callback as soon as it is complete.
         """
         logger.info("Async SOAP-only mode for provided transcription")
-        return await self.soap_generator.agenerate(transcription, language)
+        return await self.soap_generator.agenerate(
+            transcription, language, on_section=on_section
+        )
 
 
 def save_result_to_file(
@@ -164,10 +164,11 @@ You WILL generate a complete, professional SOAP note from the provided transcrip
 # Chain-of-Thought SOAP Generation Prompt (Phase 3)
 # =============================================================================
 
+# The transcript is NOT embedded here: it goes last in the user prompt (see
+# SOAP_TRANSCRIPT_PROMPT) so everything before it is identical across
+# requests and can be served from the LLM server's prefix cache.
 SOAP_GENERATION_PROMPT_COT = """You will generate a professional SOAP note from a medical consultation transcript.
-
-## Transcript (with speaker labels):
-{transcription}
+The transcript (with speaker labels) is given at the end of this message.
 
 ---
 
@@ -440,7 +441,17 @@ PLAN:
 - ICD-10 codes: Include only if certain; omitting is acceptable
 - Ensure treatments correlate with documented findings
 - IPV/abuse: Safety planning is patient-only, excludes partner/abuser
-- Missing information: Write "Not documented in this encounter"
+- Missing information: Write "Not documented in this encounter\""""
+
+
+# Per-request tail of the user prompt: the transcript, optional language
+# instruction, then the final generation cue.
+SOAP_TRANSCRIPT_PROMPT = """
+
+---
+
+## Transcript (with speaker labels):
+{transcription}{language_instruction}
 
 **Now generate the complete professional SOAP note following the process above.**"""
 
@@ -1015,6 +1026,17 @@ These examples demonstrate:
 # Complete Professional Prompt (combines System + CoT + Few-Shot)
 # =============================================================================
 
+# Request-independent start of the user prompt (few-shot examples + CoT
+# instructions), concatenated once at import
+_SOAP_USER_PROMPT_PREFIX = f"""{FEW_SHOT_EXAMPLES}
+
+---
+
+Now, using the same professional standards demonstrated in the examples above, generate a SOAP note for the NEW consultation at the end of this message:
+
+{SOAP_GENERATION_PROMPT_COT}"""
+
+
 def get_professional_soap_prompt(
     transcription: str,
     target_language: str = "en"
@@ -1028,6 +1050,11 @@ def get_professional_soap_prompt(
     3. Chain-of-Thought instructions (reasoning process)
     4. Language instruction (multi-language support)
 
+    Only the transcript and language instruction vary between requests, and
+    they come last: the system prompt and the few-shot/CoT block form a
+    stable prefix that Ollama and vLLM can reuse from their KV cache
+    instead of re-running prefill on it every time.
+
     The target_language parameter ensures the SOAP note is generated in the
     same language as the original audio/transcript. This is crucial for:
     - Maintaining clinical accuracy (no translation drift)
@@ -1060,13 +1087,12 @@ The transcript above is in {language_name}. You MUST write the entire SOAP note
     else:
         language_instruction = ""
     
-    user_prompt = f"""{FEW_SHOT_EXAMPLES}
-
----
-
-Now, using the same professional standards demonstrated in the examples above, generate a SOAP note for the following NEW consultation:
-
-{SOAP_GENERATION_PROMPT_COT.format(transcription=transcription)}{language_instruction}"""
+    # Invariant part first (few-shot + CoT), request-specific part last, so
+    # consecutive requests share a byte-identical prompt prefix
+    user_prompt = _SOAP_USER_PROMPT_PREFIX + SOAP_TRANSCRIPT_PROMPT.format(
+        transcription=transcription,
+        language_instruction=language_instruction
+    )
 
     return (MEDICAL_SCRIBE_SYSTEM_PROMPT, user_prompt)
 
@@ -3,7 +3,9 @@ SOAP Note Generator for MedScribe AI
 ==================================
 
 This module converts medical transcriptions into structured SOAP notes
-using Ollama (local LLM) with LangChain for orchestration.
+using Ollama (local LLM) with LangChain for orchestration. A vLLM server
+can be used instead for higher throughput under concurrent load
+(settings.llm_backend = "vllm").
 
 Architecture Pattern: Service with Strategy
 -------------------------------------------
@@ -31,11 +33,12 @@ LangChain:
 import asyncio
 import logging
 import re
-from typing import Optional, Protocol
+from typing import Callable, NamedTuple, Optional, Protocol
 
+import httpx
 from langchain_ollama import OllamaLLM
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 
 from config import Settings, get_settings
 from models import SOAPNote, TranscriptionResult
@@ -51,6 +54,219 @@ from exceptions import (
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Precompiled patterns for response parsing and validation
+# =============================================================================
+# Compiled once at import rather than looked up in re's internal cache on
+# every call.
+
+# SOAP section header at the start of a line, optionally after a list
+# marker, bolded or as a markdown heading: "SUBJECTIVE:", "**OBJECTIVE:**",
+# "### PLAN:", "1. SUBJECTIVE:", "- **ASSESSMENT:**"
+_SECTION_HEADER_RE = re.compile(
+    r'^[ \t]*(?:(?:\d+\.|[-*])[ \t]*)?(?:\*\*|#+[ \t]*)?'
+    r'(SUBJECTIVE|OBJECTIVE|ASSESSMENT|PLAN):(?:\*\*)?(?=\s|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Trailing material after the PLAN section
+_PLAN_END_RE = re.compile(r'---|End of SOAP Note|VALIDATION WARNINGS', re.IGNORECASE)
+
+_SOAP_SECTIONS = ('subjective', 'objective', 'assessment', 'plan')
+
+# Context sizing for Ollama: prompt tokens are estimated at 3 characters
+# per token (conservative for non-English text), plus room for the reply
+_CHARS_PER_TOKEN_ESTIMATE = 3
+_RESPONSE_TOKEN_RESERVE = 2048
+
+# Callback for streamed generation: (section_name, content) per finished section
+SectionCallback = Callable[[str, str], None]
+
+# Section content cleanup
+# Leading dashes / "Note**" artifact at the very start of a section only
+# (not per line, which would strip list bullets)
+_LEADING_ARTIFACTS_RE = re.compile(r'\A(?:-+\s*)?(?:Note\*\*\s*)?')
+# "---" separator prefixes and markdown header markers at line starts
+_LINE_MARKUP_RE = re.compile(r'^(?:---\s*(?:#+\s*)?|#+\s*)', re.MULTILINE)
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+_BARE_SECTION_HEADER_RE = re.compile(
+    r'^(SUBJECTIVE|OBJECTIVE|ASSESSMENT|PLAN|S|O|A|P):\s*$',
+    re.IGNORECASE | re.MULTILINE
+)
+_SEPARATOR_LINE_RE = re.compile(r'^---+$', re.MULTILINE)
+
+# ICD-10 codes in the assessment (format: ICD-10: XXX.XX). The lookahead
+# captures the category of codes that have a hallucination check, so each
+# match classifies itself; other codes leave 'category' unset.
+_ICD10_RE = re.compile(
+    r'icd-10:\s*(?P<code>(?=(?P<category>F32|F41|[XY])?)[A-Z]\d{2}(?:\.\d{1,2})?)',
+    re.IGNORECASE
+)
+
+# Vital sign patterns that should NEVER appear in Subjective/ROS
+# (one alternation, so the text is scanned once; matched case-insensitively)
+_VITALS_RE = re.compile(
+    r'\b(?:bp|blood\s+pressure)\s*[:=]?\s*\d+/\d+'  # BP 120/80
+    r'|\b(?:hr|heart\s+rate|rr|respiratory\s+rate|temperature)\s*[:=]?\s*\d+'  # HR 72, RR 12
+    r'|\bt\s*[:=]?\s*\d+\.?\d*\s*°?[fc]\b'  # T 98.6°F
+    r'|\bo2\s*sat\s*[:=]?\s*\d+%?',  # O2 sat 98%
+    re.IGNORECASE
+)
+
+# Medication list in the plan
+_MEDICATION_SECTION_RE = re.compile(
+    r'medications?[:]\s*(.*?)(?=\n\d+\.|\n[A-Z]|$)', re.DOTALL
+)
+
+# Scheduled frequency (TID/BID/QID) combined with PRN/as needed.
+# Matched against the lowercased plan, so no IGNORECASE.
+_TID_PRN_RES: tuple[re.Pattern, ...] = tuple(re.compile(pattern) for pattern in (
+    r'(tid|bid|qid)\s+(prn|as\s+needed)',  # TID PRN
+    r'(prn|as\s+needed)\s+(tid|bid|qid)',  # PRN TID
+    r'(tid|bid|qid).*\s+(prn|as\s+needed)',  # TID ... PRN (with words between)
+))
+
+# Benzodiazepine doses: (pattern, max mg/day, display name), matched
+# against the lowercased plan
+# Clonazepam >2mg/day, Lorazepam >4mg/day, Alprazolam >4mg/day
+_BENZO_RES: tuple[tuple[re.Pattern, float, str], ...] = tuple(
+    (re.compile(pattern), max_dose, med_name)
+    for pattern, max_dose, med_name in (
+        (r'clonazepam\s+(\d+(?:\.\d+)?)\s*mg', 2.0, 'clonazepam'),
+        (r'klonopin\s+(\d+(?:\.\d+)?)\s*mg', 2.0, 'klonopin (clonazepam)'),
+        (r'lorazepam\s+(\d+(?:\.\d+)?)\s*mg', 4.0, 'lorazepam'),
+        (r'ativan\s+(\d+(?:\.\d+)?)\s*mg', 4.0, 'ativan (lorazepam)'),
+        (r'alprazolam\s+(\d+(?:\.\d+)?)\s*mg', 4.0, 'alprazolam'),
+        (r'xanax\s+(\d+(?:\.\d+)?)\s*mg', 4.0, 'xanax (alprazolam)'),
+    )
+)
+
+
+# Banner around validation warnings appended to the PLAN
+_WARNINGS_RULE = "=" * 70
+_WARNINGS_HEADER = f"\n\n{_WARNINGS_RULE}\nVALIDATION WARNINGS\n{_WARNINGS_RULE}\n"
+_WARNINGS_FOOTER = f"\n{_WARNINGS_RULE}"
+
+
+# =============================================================================
+# Keyword sets for clinical validation (matched against lowercased text)
+# =============================================================================
+
+# Assessment terms that mark an IPV/abuse case
+_IPV_KEYWORDS = (
+    'intimate partner violence', 'ipv', 'domestic violence',
+    'domestic abuse', 'partner abuse', 'spousal abuse',
+    'physical abuse', 'assault', 'violence by partner',
+    'violence by spouse', 'relationship violence'
+)
+
+# Problematic phrases that should never appear in IPV safety plans
+_UNSAFE_IPV_PHRASES = (
+    'with partner', 'with spouse', 'with abuser',
+    'include partner', 'include spouse',
+    'discuss with partner', 'discuss with spouse',
+    'involve partner', 'involve spouse',
+    'partner in safety', 'spouse in safety'
+)
+
+# Patient-centered safety resources expected in an IPV plan
+_SAFETY_RESOURCES = (
+    'hotline', 'shelter', 'crisis', 'emergency contact',
+    'safe', 'confidential', 'resource'
+)
+
+_PAIN_MEDICATIONS = (
+    'ibuprofen', 'acetaminophen', 'naproxen', 'aspirin',
+    'tylenol', 'advil', 'motrin', 'aleve',
+    'oxycodone', 'hydrocodone', 'morphine', 'tramadol'
+)
+
+_PAIN_KEYWORDS = (
+    'pain', 'tender', 'ache', 'sore', 'discomfort',
+    'hurts', 'painful'
+)
+
+# Preventive/maintenance items that don't need documented findings
+_MAINTENANCE_MED_TERMS = ('vitamin', 'supplement', 'follow-up', 'continue')
+
+
+def _response_text(response) -> str:
+    """
+    Extract the text from an LLM response.
+
+    Completion models (OllamaLLM) return a str; chat models (ChatOpenAI
+    for vLLM) return an AIMessage.
+    """
+    if isinstance(response, BaseMessage):
+        return response.content
+    return response
+
+
+class _LoweredSections(NamedTuple):
+    """
+    Lowercased copies of the four SOAP sections.
+
+    Built once per note and shared by all validators, so each section is
+    lowercased exactly once.
+    """
+    subjective: str
+    objective: str
+    assessment: str
+    plan: str
+
+    @classmethod
+    def from_note(cls, soap_note: SOAPNote) -> "_LoweredSections":
+        return cls(
+            soap_note.subjective.lower(),
+            soap_note.objective.lower(),
+            soap_note.assessment.lower(),
+            soap_note.plan.lower()
+        )
+
+
+def _check_icd10_depression_code(code: str, assessment_lower: str) -> Optional[str]:
+    """F32.X = Depression, NOT anxiety."""
+    if 'anxiety' not in assessment_lower:
+        return None
+    logger.error(f"ICD-10 hallucination detected: {code} for anxiety")
+    return (
+        f"⚠️  ICD-10 HALLUCINATION: Code {code} is for Major Depressive Disorder, "
+        f"but diagnosis mentions 'anxiety'. F32.X codes are for depression, NOT anxiety. "
+        f"Anxiety disorders use F41.X codes. This is a common hallucination error."
+    )
+
+
+def _check_icd10_anxiety_code(code: str, assessment_lower: str) -> Optional[str]:
+    """F41.X = Anxiety; flag it when the diagnosis is depression."""
+    if 'depress' not in assessment_lower or 'anxiety' in assessment_lower:
+        return None
+    return (
+        f"⚠️  ICD-10 MISMATCH: Code {code} is for anxiety disorders, "
+        f"but diagnosis primarily mentions depression. Consider F32.X codes instead."
+    )
+
+
+def _check_icd10_external_cause_code(code: str, assessment_lower: str) -> Optional[str]:
+    """X/Y codes (External causes) should not be the primary diagnosis."""
+    if 'external cause' in assessment_lower or 'secondary' in assessment_lower:
+        return None
+    logger.error(f"External cause code used as primary diagnosis: {code}")
+    return (
+        f"⚠️  ICD-10 ERROR: Code {code} is an External Cause code (accidents, assaults, events). "
+        f"These should NOT be used as primary diagnoses for medical conditions. "
+        f"Example hallucination: X34.0 (earthquake victim) for IPV."
+    )
+
+
+# Hallucination check per _ICD10_RE category
+_ICD10_CATEGORY_CHECKS: dict[str, Callable[[str, str], Optional[str]]] = {
+    'F32': _check_icd10_depression_code,
+    'F41': _check_icd10_anxiety_code,
+    'X': _check_icd10_external_cause_code,
+    'Y': _check_icd10_external_cause_code,
+}
+
+
 class SOAPGeneratorProtocol(Protocol):
     """
     Protocol for SOAP note generators.
@@ -77,7 +293,12 @@ class SOAPGeneratorProtocol(Protocol):
         """
         ...
     
-    async def agenerate(self, transcription: str, language: str = "en") -> SOAPNote:
+    async def agenerate(
+        self,
+        transcription: str,
+        language: str = "en",
+        on_section: Optional[SectionCallback] = None
+    ) -> SOAPNote:
         """
         Generate a SOAP note from transcription text (asynchronous).
         
@@ -86,6 +307,9 @@ class SOAPGeneratorProtocol(Protocol):
         Args:
             transcription: The medical consultation transcript
             language: ISO 639-1 language code for the output SOAP note.
+            on_section: Optional callback invoked with (section_name, content)
+                       as each section becomes available, before the full
+                       note is returned.
             
         Returns:
             Structured SOAPNote object
@@ -117,7 +341,7 @@ class OllamaSOAPGenerator:
     def __init__(
         self,
         settings: Optional[Settings] = None,
-        llm: Optional[OllamaLLM] = None
+        llm: Optional[BaseLanguageModel] = None
     ):
         """
         Initialize the SOAP generator.
@@ -134,13 +358,13 @@ class OllamaSOAPGenerator:
         self.settings = settings or get_settings()
         self._llm = llm
         self._llm_initialized = llm is not None
+        # Copies of the Ollama handle with a larger num_ctx, by size
+        self._llm_by_num_ctx: dict[int, OllamaLLM] = {}
         
-        logger.info(
-            f"OllamaSOAPGenerator initialized with model: {self.settings.ollama_model}"
-        )
+        logger.info(f"{type(self).__name__} initialized")
     
     @property
-    def llm(self) -> OllamaLLM:
+    def llm(self) -> BaseLanguageModel:
         """
         Lazy-load the LLM instance.
         
@@ -171,14 +395,19 @@ class OllamaSOAPGenerator:
                 temperature=self.settings.ollama_temperature,
                 # Context window from settings (supports long transcripts + few-shot examples)
                 num_ctx=self.settings.ollama_context_window,
+                # Keep the model (and the cached few-shot prompt prefix) loaded
+                # between requests
+                keep_alive=self.settings.ollama_keep_alive,
             )
             
-            # Test the connection with a simple prompt
-            self._test_connection()
+            if not self.settings.skip_connection_test:
+                self._test_connection()
             
             self._llm_initialized = True
             logger.info("Ollama LLM initialized successfully")
             
+        except (OllamaConnectionError, ModelNotFoundError):
+            raise
         except Exception as e:
             error_msg = str(e)
             if "connection" in error_msg.lower() or "refused" in error_msg.lower():
@@ -190,22 +419,32 @@ class OllamaSOAPGenerator:
     
     def _test_connection(self) -> None:
         """
-        Test the Ollama connection with a simple prompt.
+        Check the Ollama server via its /api/tags model listing.
         
         This validates:
         1. Ollama is running
         2. The model is available
-        3. Basic inference works
+        
+        A plain HTTP GET rather than a test prompt, so the first request
+        doesn't pay for a full model inference.
         """
         try:
-            # Simple test prompt
-            test_response = self._llm.invoke("Say 'OK' if you're working.")
-            logger.debug(f"Ollama test response: {test_response[:50]}...")
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "not found" in error_msg or "pull" in error_msg:
-                raise ModelNotFoundError(self.settings.ollama_model)
-            raise
+            response = httpx.get(self.settings.ollama_tags_url, timeout=3.0)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise OllamaConnectionError(
+                url=self.settings.ollama_base_url,
+                original_error=str(e)
+            )
+        
+        # Tags are listed in full ("llama3.2:latest"); an untagged model
+        # name refers to ":latest"
+        installed = {
+            m.get("name") for m in response.json().get("models", ())
+        }
+        model = self.settings.ollama_model
+        if model not in installed and f"{model}:latest" not in installed:
+            raise ModelNotFoundError(model)
     
     def generate(self, transcription: str, language: str = "en") -> SOAPNote:
         """
@@ -235,7 +474,8 @@ class OllamaSOAPGenerator:
         Raises:
             SOAPGenerationError: If generation or parsing fails
         """
-        if not transcription or not transcription.strip():
+        # isspace() checks in place; strip() would copy the whole transcript
+        if not transcription or transcription.isspace():
             raise SOAPGenerationError(
                 reason="Empty transcription provided",
                 transcription_preview=""
@@ -247,65 +487,14 @@ class OllamaSOAPGenerator:
         )
 
         try:
-            # Step 1: Build the professional prompt with language support
-            # get_professional_soap_prompt returns (system_prompt, user_prompt)
-            # where user_prompt includes:
-            #   - 5 few-shot examples showing professional format
-            #   - Chain-of-Thought instructions
-            #   - The actual transcription to process
-            #   - Language instruction (if not English)
-            system_prompt, user_prompt = get_professional_soap_prompt(
-                transcription,
-                target_language=language
-            )
-
-            # Using LangChain's ChatPromptTemplate for structured prompting
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", system_prompt),
-                ("human", user_prompt)
-            ])
-
-            # Step 2: Create the chain
-            # Chain pattern: prompt -> llm -> output_parser
-            # The professional prompt is ~15K tokens (few-shot examples)
-            # but dramatically improves output quality
-            chain = prompt | self.llm | StrOutputParser()
+            messages = self._build_messages(transcription, language)
 
-            # Step 3: Execute the chain
             logger.debug("Sending request to Ollama with professional prompt (includes few-shot examples)...")
-            raw_response = chain.invoke({})  # No variables needed - already in user_prompt
+            raw_response = _response_text(self._llm_for_messages(messages).invoke(messages))
 
             logger.debug(f"Received response ({len(raw_response)} chars)")
 
-            # Step 4: Parse the response into structured SOAPNote
-            soap_note = self._parse_soap_response(raw_response)
-
-            # Step 5: Validate clinical safety and logic
-            logger.debug("Validating SOAP note for safety and clinical logic...")
-
-            safety_warnings = self._validate_clinical_safety(soap_note)
-            logic_warnings = self._validate_clinical_logic(soap_note)
-
-            all_warnings = safety_warnings + logic_warnings
-
-            # If there are warnings, append them to the PLAN section
-            if all_warnings:
-                logger.warning(f"SOAP note validation found {len(all_warnings)} issue(s)")
-
-                warning_text = "\n\n" + "="*70 + "\n"
-                warning_text += "VALIDATION WARNINGS\n"
-                warning_text += "="*70 + "\n"
-                warning_text += "\n".join(all_warnings)
-                warning_text += "\n" + "="*70
-
-                # Append warnings to plan section
-                soap_note.plan = soap_note.plan + warning_text
-
-                # Log each warning
-                for warning in all_warnings:
-                    logger.warning(warning)
-            else:
-                logger.info("SOAP note passed all validation checks")
+            soap_note = self._finalize_soap(raw_response)
 
             logger.info("Professional SOAP note generated successfully")
             return soap_note
@@ -319,7 +508,12 @@ class OllamaSOAPGenerator:
                 transcription_preview=transcription[:500]  # Only preview first 500 chars
             )
 
-    async def agenerate(self, transcription: str, language: str = "en") -> SOAPNote:
+    async def agenerate(
+        self,
+        transcription: str,
+        language: str = "en",
+        on_section: Optional[SectionCallback] = None
+    ) -> SOAPNote:
         """
         Async version of generate() for use with FastAPI/async frameworks.
 
@@ -327,9 +521,16 @@ class OllamaSOAPGenerator:
         blocking the event loop. This is critical for web servers handling
         multiple concurrent requests.
 
+        With on_section, the response is streamed (astream) and each SOAP
+        section is reported as soon as it is complete, so callers can show
+        SUBJECTIVE long before decoding finishes. Reported sections are
+        previews: validation warnings are only added to the returned note.
+
         Args:
             transcription: The medical consultation transcript
             language: ISO 639-1 language code for the SOAP note output
+            on_section: Optional callback invoked with (section_name, content)
+                       for each section as it finishes streaming
 
         Returns:
             Structured SOAPNote object with professional clinical documentation
@@ -337,7 +538,8 @@ class OllamaSOAPGenerator:
         Raises:
             SOAPGenerationError: If generation or parsing fails
         """
-        if not transcription or not transcription.strip():
+        # isspace() checks in place; strip() would copy the whole transcript
+        if not transcription or transcription.isspace():
             raise SOAPGenerationError(
                 reason="Empty transcription provided",
                 transcription_preview=""
@@ -349,54 +551,21 @@ class OllamaSOAPGenerator:
         )
 
         try:
-            # Step 1: Build the professional prompt with language support
-            system_prompt, user_prompt = get_professional_soap_prompt(
-                transcription,
-                target_language=language
-            )
-
-            # Using LangChain's ChatPromptTemplate for structured prompting
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", system_prompt),
-                ("human", user_prompt)
-            ])
+            messages = self._build_messages(transcription, language)
 
-            # Step 2: Create the chain
-            chain = prompt | self.llm | StrOutputParser()
+            llm = self._llm_for_messages(messages)
 
-            # Step 3: Execute the chain ASYNCHRONOUSLY
-            # This is the key difference - using ainvoke instead of invoke
-            logger.debug("Sending async request to Ollama...")
-            raw_response = await chain.ainvoke({})  # Non-blocking!
+            if on_section is None:
+                # This is the key difference - using ainvoke instead of invoke
+                logger.debug("Sending async request to Ollama...")
+                raw_response = _response_text(await llm.ainvoke(messages))  # Non-blocking!
+            else:
+                logger.debug("Streaming async request to Ollama...")
+                raw_response = await self._astream_response(llm, messages, on_section)
 
             logger.debug(f"Received async response ({len(raw_response)} chars)")
 
-            # Step 4: Parse the response into structured SOAPNote
-            soap_note = self._parse_soap_response(raw_response)
-
-            # Step 5: Validate clinical safety and logic
-            logger.debug("Validating SOAP note for safety and clinical logic...")
-
-            safety_warnings = self._validate_clinical_safety(soap_note)
-            logic_warnings = self._validate_clinical_logic(soap_note)
-
-            all_warnings = safety_warnings + logic_warnings
-
-            if all_warnings:
-                logger.warning(f"SOAP note validation found {len(all_warnings)} issue(s)")
-
-                warning_text = "\n\n" + "="*70 + "\n"
-                warning_text += "VALIDATION WARNINGS\n"
-                warning_text += "="*70 + "\n"
-                warning_text += "\n".join(all_warnings)
-                warning_text += "\n" + "="*70
-
-                soap_note.plan = soap_note.plan + warning_text
-
-                for warning in all_warnings:
-                    logger.warning(warning)
-            else:
-                logger.info("SOAP note passed all validation checks")
+            soap_note = self._finalize_soap(raw_response)
 
             logger.info("Professional SOAP note generated successfully (async)")
             return soap_note
@@ -409,18 +578,247 @@ class OllamaSOAPGenerator:
                 reason=str(e),
                 transcription_preview=transcription[:500]
             )
+
+    def _build_messages(self, transcription: str, language: str) -> list[BaseMessage]:
+        """
+        Build the system/user messages for one transcription.
+
+        Shared by generate() and agenerate(); only the invocation differs.
+        The messages go straight to the LLM: the prompt is fully formatted
+        already, so a ChatPromptTemplate would only re-scan ~15K tokens of
+        text for template variables (and choke on braces in a transcript).
+
+        Args:
+            transcription: The medical consultation transcript
+            language: ISO 639-1 language code for the SOAP note output
+
+        Returns:
+            [SystemMessage, HumanMessage]
+        """
+        # get_professional_soap_prompt returns (system_prompt, user_prompt)
+        # where user_prompt includes:
+        #   - 5 few-shot examples showing professional format
+        #   - Chain-of-Thought instructions
+        #   - The actual transcription to process
+        #   - Language instruction (if not English)
+        system_prompt, user_prompt = get_professional_soap_prompt(
+            transcription,
+            target_language=language
+        )
+
+        # The professional prompt is ~15K tokens (few-shot examples)
+        # but dramatically improves output quality
+        return [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_prompt)
+        ]
+
+    def _llm_for_messages(self, messages: list[BaseMessage]) -> BaseLanguageModel:
+        """
+        Get an Ollama handle whose context window fits this prompt.
+
+        Ollama silently drops the start of a prompt that exceeds num_ctx,
+        which would cut off the few-shot examples. The window is sized from
+        the prompt length, doubling from ollama_context_window up to
+        ollama_context_window_max. Power-of-two steps keep the number of
+        distinct sizes small: Ollama reloads the model whenever num_ctx
+        changes, so nearly all requests should land on the same size.
+
+        Injected non-Ollama LLMs are returned unchanged.
+
+        Args:
+            messages: Prompt messages from _build_messages()
+
+        Returns:
+            LLM handle to invoke
+        """
+        llm = self.llm
+        if not isinstance(llm, OllamaLLM):
+            return llm
+
+        prompt_chars = sum(len(message.content) for message in messages)
+        needed = prompt_chars // _CHARS_PER_TOKEN_ESTIMATE + _RESPONSE_TOKEN_RESERVE
+
+        num_ctx = self.settings.ollama_context_window
+        while num_ctx < needed and num_ctx < self.settings.ollama_context_window_max:
+            num_ctx *= 2
+        num_ctx = min(num_ctx, max(self.settings.ollama_context_window_max,
+                                   self.settings.ollama_context_window))
+        if num_ctx < needed:
+            logger.warning(
+                f"Prompt needs ~{needed} tokens but the context window is capped "
+                f"at {num_ctx}; Ollama will truncate the start of the prompt"
+            )
+
+        if num_ctx == llm.num_ctx:
+            return llm
+        sized = self._llm_by_num_ctx.get(num_ctx)
+        if sized is None:
+            # Shallow copy: shares the underlying HTTP clients
+            sized = llm.model_copy(update={"num_ctx": num_ctx})
+            self._llm_by_num_ctx[num_ctx] = sized
+        return sized
+
+    async def _astream_response(
+        self,
+        llm: BaseLanguageModel,
+        messages: list[BaseMessage],
+        on_section: SectionCallback
+    ) -> str:
+        """
+        Stream the LLM response, reporting each SOAP section as it completes.
+
+        A section is complete once the next section header arrives (the last
+        one once the stream ends). Headers are only matched on complete
+        lines, so a half-streamed header is never mistaken for a short one.
+
+        Args:
+            llm: The LLM handle to stream from
+            messages: Prompt messages from _build_messages()
+            on_section: Called with (section_name, content) per section
+
+        Returns:
+            The complete raw response text
+        """
+        response = ""
+        scanned = 0  # Offset up to which headers have been looked for
+        current = None  # (section_name, body_start) of the open section
+        reported = set()
+
+        async for chunk in llm.astream(messages):
+            text = _response_text(chunk)
+            response += text
+            if "\n" not in text:
+                continue
+
+            line_end = response.rfind("\n")
+            current = self._advance_sections(
+                response, scanned, line_end, current, on_section, reported
+            )
+            scanned = line_end
+
+        # Headers on the final, unterminated line, then the last section
+        current = self._advance_sections(
+            response, scanned, len(response), current, on_section, reported
+        )
+        if current is not None:
+            body = response[current[1]:]
+            if current[0] == 'plan':
+                end = _PLAN_END_RE.search(body)
+                if end:
+                    body = body[:end.start()]
+            self._report_section(on_section, reported, current[0], body)
+
+        return response
+
+    def _advance_sections(
+        self,
+        response: str,
+        start: int,
+        end: int,
+        current: Optional[tuple[str, int]],
+        on_section: SectionCallback,
+        reported: set
+    ) -> Optional[tuple[str, int]]:
+        """
+        Handle the section headers in response[start:end].
+
+        Each new header closes (and reports) the open section. A header
+        repeating the open section is content, as in _parse_soap_response.
+
+        Returns:
+            The (section_name, body_start) of the section now open
+        """
+        for match in _SECTION_HEADER_RE.finditer(response, start, end):
+            section_name = match.group(1).lower()
+            if current is not None and section_name == current[0]:
+                continue
+            if current is not None:
+                self._report_section(
+                    on_section, reported,
+                    current[0], response[current[1]:match.start()]
+                )
+            current = (section_name, match.end())
+        return current
+
+    def _report_section(
+        self,
+        on_section: SectionCallback,
+        reported: set,
+        section_name: str,
+        body: str
+    ) -> None:
+        """
+        Pass a streamed section to the callback, once per section.
+
+        Empty or artifact-only bodies are skipped, like in parsing, so a
+        later occurrence of the same header can still be reported.
+        """
+        if section_name in reported:
+            return
+        content = self._meaningful_content(body)
+        if content is None:
+            return
+        reported.add(section_name)
+        try:
+            on_section(section_name, content)
+        except Exception as e:
+            logger.warning(f"Section callback failed: {e}")
+
+    def _finalize_soap(self, raw_response: str) -> SOAPNote:
+        """
+        Turn a raw LLM response into a validated SOAPNote.
+
+        Parses the sections, runs the safety and clinical-logic validators,
+        and appends any warnings to the PLAN section.
+
+        Args:
+            raw_response: Raw text response from LLM
+
+        Returns:
+            Structured SOAPNote object
+        """
+        soap_note = self._parse_soap_response(raw_response)
+
+        # Validate clinical safety and logic
+        logger.debug("Validating SOAP note for safety and clinical logic...")
+
+        lowered = _LoweredSections.from_note(soap_note)
+        safety_warnings = self._validate_clinical_safety(soap_note, lowered)
+        logic_warnings = self._validate_clinical_logic(lowered)
+
+        all_warnings = safety_warnings + logic_warnings
+
+        # If there are warnings, append them to the PLAN section
+        if all_warnings:
+            logger.warning(f"SOAP note validation found {len(all_warnings)} issue(s)")
+
+            soap_note.plan = "".join((
+                soap_note.plan,
+                _WARNINGS_HEADER,
+                "\n".join(all_warnings),
+                _WARNINGS_FOOTER
+            ))
+
+            # Log each warning
+            for warning in all_warnings:
+                logger.warning(warning)
+        else:
+            logger.info("SOAP note passed all validation checks")
+
+        return soap_note
     
     def _parse_soap_response(self, response: str) -> SOAPNote:
         """
         Parse the LLM's text response into a structured SOAPNote.
         
         This is a crucial function that converts unstructured LLM output
-        into our structured data model. We use regex patterns to extract
-        each SOAP section.
+        into our structured data model. The response is split on section
+        headers in a single pass.
         
         Parsing Strategy:
-        1. Look for section headers (SUBJECTIVE:, OBJECTIVE:, etc.)
-        2. Extract content between headers
+        1. Split on section headers (SUBJECTIVE:, OBJECTIVE:, etc.)
+        2. Take the content between one header and the next
         3. Skip empty sections (LLM sometimes outputs empty headers first)
         4. Clean and validate each section
         5. Create SOAPNote object
@@ -433,31 +831,48 @@ class OllamaSOAPGenerator:
         """
         logger.debug("Parsing SOAP response...")
         
-        # Define section patterns - match all occurrences
-        # Using case-insensitive matching and flexible whitespace
-        patterns = {
-            'subjective': r'(?:\*\*)?SUBJECTIVE:(?:\*\*)?[\s\n]+(.*?)(?=(?:\*\*)?OBJECTIVE:(?:\*\*)?|---[\s\n]+(?:\*\*)?OBJECTIVE|$)',
-            'objective': r'(?:\*\*)?OBJECTIVE:(?:\*\*)?[\s\n]+(.*?)(?=(?:\*\*)?ASSESSMENT:(?:\*\*)?|---[\s\n]+(?:\*\*)?ASSESSMENT|$)',
-            'assessment': r'(?:\*\*)?ASSESSMENT:(?:\*\*)?[\s\n]+(.*?)(?=(?:\*\*)?PLAN:(?:\*\*)?|---[\s\n]+(?:\*\*)?PLAN|$)',
-            'plan': r'(?:\*\*)?PLAN:(?:\*\*)?[\s\n]+(.*?)(?=---|End of SOAP Note|VALIDATION WARNINGS|$)'
+        # split() with one capturing group yields
+        # [preamble, header, body, header, body, ...]
+        parts = _SECTION_HEADER_RE.split(response)
+        
+        # Every body found for each section, in order of appearance. A header
+        # repeating the section it sits in (e.g. a "Plan:" line inside the
+        # PLAN) is kept as content rather than starting a new candidate.
+        # Pieces are collected in lists and joined once, so a long run of
+        # repeated headers stays linear.
+        pieces = {section_name: [] for section_name in _SOAP_SECTIONS}
+        previous = None
+        for header, body in zip(parts[1::2], parts[2::2]):
+            section_name = header.lower()
+            if section_name == previous:
+                pieces[section_name][-1].extend((header, ":", body))
+            else:
+                pieces[section_name].append([body])
+            previous = section_name
+        
+        candidates = {
+            section_name: ["".join(chunks) for chunks in bodies]
+            for section_name, bodies in pieces.items()
         }
         
+        # The PLAN runs until the end-of-note marker or appended warnings
+        plan_bodies = candidates['plan']
+        for i, body in enumerate(plan_bodies):
+            end = _PLAN_END_RE.search(body)
+            if end:
+                plan_bodies[i] = body[:end.start()]
+        
         sections = {}
         
-        for section_name, pattern in patterns.items():
-            # Find ALL matches for this section
-            matches = list(re.finditer(pattern, response, re.IGNORECASE | re.DOTALL))
+        for section_name in _SOAP_SECTIONS:
+            matches = candidates[section_name]
             
             if matches:
                 # Try each match and use the first one with meaningful content
                 content = None
-                for match in matches:
-                    candidate = match.group(1).strip()
-                    # Clean up the content
-                    cleaned = self._clean_section_content(candidate)
-                    # Use this match if it has substantial content (not just dashes/whitespace)
-                    if len(cleaned) > 5 and cleaned not in ['---', 'Note**']:
-                        content = cleaned
+                for candidate in matches:
+                    content = self._meaningful_content(candidate)
+                    if content is not None:
                         break
                 
                 if content:
@@ -481,6 +896,16 @@ class OllamaSOAPGenerator:
             plan=sections['plan']
         )
     
+    def _meaningful_content(self, body: str) -> Optional[str]:
+        """
+        Clean a section body, or return None if nothing substantial is left.
+        """
+        cleaned = self._clean_section_content(body)
+        # Substantial content, not just dashes/whitespace
+        if len(cleaned) > 5 and cleaned not in ['---', 'Note**']:
+            return cleaned
+        return None
+    
     def _clean_section_content(self, content: str) -> str:
         """
         Clean up section content from LLM response.
@@ -496,33 +921,27 @@ class OllamaSOAPGenerator:
         content = content.strip()
         
         # Remove leading dashes and Note** artifacts
-        content = re.sub(r'^[-]+\s*', '', content)
-        content = re.sub(r'^Note\*\*\s*', '', content)
-        content = re.sub(r'^---\s*', '', content, flags=re.MULTILINE)
-        
-        # Remove markdown headers if present
-        content = re.sub(r'^#+\s*', '', content, flags=re.MULTILINE)
+        content = _LEADING_ARTIFACTS_RE.sub('', content, count=1)
         
-        # Remove excessive newlines
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        # Remove --- separators and markdown headers if present
+        content = _LINE_MARKUP_RE.sub('', content)
         
         # Remove any remaining section headers that got included (non-bolded versions)
-        content = re.sub(
-            r'^(SUBJECTIVE|OBJECTIVE|ASSESSMENT|PLAN|S|O|A|P):\s*$',
-            '',
-            content,
-            flags=re.IGNORECASE | re.MULTILINE
-        )
+        content = _BARE_SECTION_HEADER_RE.sub('', content)
         
         # Remove standalone dashes on their own lines
-        content = re.sub(r'^---+$', '', content, flags=re.MULTILINE)
+        content = _SEPARATOR_LINE_RE.sub('', content)
         
-        # Clean up multiple blank lines again after removals
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        # Collapse excessive blank lines (once, after all removals)
+        content = _EXCESS_NEWLINES_RE.sub('\n\n', content)
         
         return content.strip()
 
-    def _validate_clinical_safety(self, soap_note: SOAPNote) -> list[str]:
+    def _validate_clinical_safety(
+        self,
+        soap_note: SOAPNote,
+        lowered: _LoweredSections
+    ) -> list[str]:
         """
         Validate SOAP note for critical safety issues.
 
@@ -530,52 +949,38 @@ class OllamaSOAPGenerator:
         1. IPV/Abuse cases with unsafe safety planning
         2. Problematic safety plan language
 
+        Args:
+            soap_note: The parsed SOAP note
+            lowered: Lowercased sections of the same note
+
         Returns:
             List of warning messages (empty if no issues)
         """
         warnings = []
 
         # Check if this is an IPV/abuse case
-        assessment_lower = soap_note.assessment.lower()
-        plan_lower = soap_note.plan.lower()
-
-        ipv_keywords = [
-            'intimate partner violence', 'ipv', 'domestic violence',
-            'domestic abuse', 'partner abuse', 'spousal abuse',
-            'physical abuse', 'assault', 'violence by partner',
-            'violence by spouse', 'relationship violence'
-        ]
+        assessment_lower = lowered.assessment
+        plan_lower = lowered.plan
 
-        is_ipv_case = any(keyword in assessment_lower for keyword in ipv_keywords)
+        is_ipv_case = any(keyword in assessment_lower for keyword in _IPV_KEYWORDS)
 
         if is_ipv_case:
             logger.info("Detected IPV/abuse case - validating safety plan...")
 
-            # Problematic phrases that should never appear in IPV safety plans
-            unsafe_phrases = [
-                'with partner', 'with spouse', 'with abuser',
-                'include partner', 'include spouse',
-                'discuss with partner', 'discuss with spouse',
-                'involve partner', 'involve spouse',
-                'partner in safety', 'spouse in safety'
-            ]
-
-            for phrase in unsafe_phrases:
-                if phrase in plan_lower:
-                    warnings.append(
-                        f"⚠️  CRITICAL SAFETY ISSUE: IPV case contains unsafe phrase '{phrase}' in safety plan. "
-                        f"Safety planning must NEVER include the abuser/partner. "
-                        f"Patient safety may be compromised."
-                    )
-                    logger.error(f"Safety violation detected: '{phrase}' found in IPV safety plan")
+            # One warning listing every hit, rather than one per phrase
+            unsafe_hits = [phrase for phrase in _UNSAFE_IPV_PHRASES if phrase in plan_lower]
+            if unsafe_hits:
+                hits = ", ".join(f"'{phrase}'" for phrase in unsafe_hits)
+                warnings.append(
+                    f"⚠️  CRITICAL SAFETY ISSUE: IPV case contains unsafe "
+                    f"phrase{'s' if len(unsafe_hits) > 1 else ''} {hits} in safety plan. "
+                    f"Safety planning must NEVER include the abuser/partner. "
+                    f"Patient safety may be compromised."
+                )
+                logger.error(f"Safety violation detected: {hits} found in IPV safety plan")
 
             # Check if proper safety resources are mentioned
-            safety_resources = [
-                'hotline', 'shelter', 'crisis', 'emergency contact',
-                'safe', 'confidential', 'resource'
-            ]
-
-            has_safety_resources = any(resource in plan_lower for resource in safety_resources)
+            has_safety_resources = any(resource in plan_lower for resource in _SAFETY_RESOURCES)
 
             if not has_safety_resources:
                 warnings.append(
@@ -584,12 +989,16 @@ class OllamaSOAPGenerator:
                 )
 
         # Check ICD-10 codes for common hallucinations
-        icd_warnings = self._validate_icd10_codes(soap_note)
+        icd_warnings = self._validate_icd10_codes(soap_note, lowered)
         warnings.extend(icd_warnings)
 
         return warnings
 
-    def _validate_icd10_codes(self, soap_note: SOAPNote) -> list[str]:
+    def _validate_icd10_codes(
+        self,
+        soap_note: SOAPNote,
+        lowered: _LoweredSections
+    ) -> list[str]:
         """
         Validate ICD-10 codes for common hallucinations and errors.
 
@@ -597,53 +1006,34 @@ class OllamaSOAPGenerator:
         1. Wrong code categories (F32 for anxiety, X codes for medical diagnoses)
         2. Code format validation
 
+        Args:
+            soap_note: The parsed SOAP note
+            lowered: Lowercased sections of the same note
+
         Returns:
             List of warning messages (empty if no issues)
         """
         warnings = []
-        assessment_lower = soap_note.assessment.lower()
+        assessment_lower = lowered.assessment
 
         # Find ICD-10 codes in assessment (format: ICD-10: XXX.XX)
-        icd_pattern = r'icd-10:\s*([A-Z]\d{2}(?:\.\d{1,2})?)'
-        icd_matches = re.findall(icd_pattern, soap_note.assessment, re.IGNORECASE)
-
-        if icd_matches:
-            logger.debug(f"Found {len(icd_matches)} ICD-10 code(s): {icd_matches}")
-
-            for code in icd_matches:
-                code_upper = code.upper()
-                logger.debug(f"Validating ICD-10 code: {code_upper}")
-
-                # Check for common hallucinations
-                # F32.X = Depression, NOT anxiety
-                if code_upper.startswith('F32') and 'anxiety' in assessment_lower:
-                    warnings.append(
-                        f"⚠️  ICD-10 HALLUCINATION: Code {code_upper} is for Major Depressive Disorder, "
-                        f"but diagnosis mentions 'anxiety'. F32.X codes are for depression, NOT anxiety. "
-                        f"Anxiety disorders use F41.X codes. This is a common hallucination error."
-                    )
-                    logger.error(f"ICD-10 hallucination detected: {code_upper} for anxiety")
-
-                # X codes (External causes) should not be primary diagnosis
-                if code_upper.startswith('X') or code_upper.startswith('Y'):
-                    if not ('external cause' in assessment_lower or 'secondary' in assessment_lower):
-                        warnings.append(
-                            f"⚠️  ICD-10 ERROR: Code {code_upper} is an External Cause code (accidents, assaults, events). "
-                            f"These should NOT be used as primary diagnoses for medical conditions. "
-                            f"Example hallucination: X34.0 (earthquake victim) for IPV."
-                        )
-                        logger.error(f"External cause code used as primary diagnosis: {code_upper}")
+        for match in _ICD10_RE.finditer(soap_note.assessment):
+            category = match['category']
+            logger.debug(f"Validating ICD-10 code: {match['code']}")
 
-                # Check for mismatched mental health codes
-                if code_upper.startswith('F41') and 'depress' in assessment_lower and 'anxiety' not in assessment_lower:
-                    warnings.append(
-                        f"⚠️  ICD-10 MISMATCH: Code {code_upper} is for anxiety disorders, "
-                        f"but diagnosis primarily mentions depression. Consider F32.X codes instead."
-                    )
+            # Only codes in a checked category need any further work
+            if category is None:
+                continue
+
+            warning = _ICD10_CATEGORY_CHECKS[category.upper()](
+                match['code'].upper(), assessment_lower
+            )
+            if warning:
+                warnings.append(warning)
 
         return warnings
 
-    def _validate_clinical_logic(self, soap_note: SOAPNote) -> list[str]:
+    def _validate_clinical_logic(self, lowered: _LoweredSections) -> list[str]:
         """
         Validate SOAP note for clinical logic issues.
 
@@ -652,65 +1042,43 @@ class OllamaSOAPGenerator:
         2. Vital signs in ROS (should be in Objective)
         3. Clinical inconsistencies
 
+        Args:
+            lowered: Lowercased sections of the note
+
         Returns:
             List of warning messages (empty if no issues)
         """
         warnings = []
 
         # Check for vital signs in ROS (common error from problematic output)
-        subjective_lower = soap_note.subjective.lower()
+        subjective_lower = lowered.subjective
 
         # Log what we're checking for debugging
         logger.debug(f"Validating clinical logic. Subjective text length: {len(subjective_lower)} chars")
         logger.debug(f"First 200 chars of subjective (lowercase): {subjective_lower[:200]}")
 
-        # Vital sign patterns that should NEVER appear in Subjective/ROS
-        vital_patterns = [
-            r'bp\s*[:=]?\s*\d+[/]\d+',  # BP 120/80
-            r'blood pressure\s*[:=]?\s*\d+[/]\d+',
-            r'hr\s*[:=]?\s*\d+',  # HR 72
-            r'heart rate\s*[:=]?\s*\d+',
-            r'rr\s*[:=]?\s*\d+',  # RR 12
-            r'respiratory rate\s*[:=]?\s*\d+',
-            r'temperature\s*[:=]?\s*\d+',
-            r't\s*[:=]?\s*\d+\.?\d*\s*°?[fc]',  # T 98.6°F
-            r'o2\s*sat\s*[:=]?\s*\d+%?',  # O2 sat 98%
-        ]
-
-        for pattern in vital_patterns:
-            match = re.search(pattern, subjective_lower)
-            if match:
-                logger.debug(f"Vital sign pattern '{pattern}' matched: '{match.group()}'")
-                warnings.append(
-                    f"⚠️  STRUCTURE ERROR: Vital sign measurement found in SUBJECTIVE section. "
-                    f"All vital signs (BP, HR, RR, T, O2 sat) must be in OBJECTIVE section only. "
-                    f"ROS should contain patient-reported symptoms, not measured values."
-                )
-                logger.warning(f"Vital signs detected in Subjective section: '{match.group()}'")
-                break  # Only warn once for this issue
+        # Vital signs should NEVER appear in Subjective/ROS
+        # Only the first hit matters - we warn once for this issue
+        match = _VITALS_RE.search(subjective_lower)
+        if match:
+            warnings.append(
+                f"⚠️  STRUCTURE ERROR: Vital sign measurement found in SUBJECTIVE section. "
+                f"All vital signs (BP, HR, RR, T, O2 sat) must be in OBJECTIVE section only. "
+                f"ROS should contain patient-reported symptoms, not measured values."
+            )
+            logger.warning(f"Vital signs detected in Subjective section: '{match.group()}'")
 
         # Check for pain medications without documented pain
-        plan_lower = soap_note.plan.lower()
-        objective_lower = soap_note.objective.lower()
+        plan_lower = lowered.plan
+        objective_lower = lowered.objective
 
-        pain_meds = [
-            'ibuprofen', 'acetaminophen', 'naproxen', 'aspirin',
-            'tylenol', 'advil', 'motrin', 'aleve',
-            'oxycodone', 'hydrocodone', 'morphine', 'tramadol'
-        ]
-
-        has_pain_med = any(med in plan_lower for med in pain_meds)
+        has_pain_med = any(med in plan_lower for med in _PAIN_MEDICATIONS)
 
         if has_pain_med:
             # Check if pain is documented in subjective or objective
-            pain_keywords = [
-                'pain', 'tender', 'ache', 'sore', 'discomfort',
-                'hurts', 'painful'
-            ]
-
             has_pain_documented = (
-                any(keyword in subjective_lower for keyword in pain_keywords) or
-                any(keyword in objective_lower for keyword in pain_keywords)
+                any(keyword in subjective_lower for keyword in _PAIN_KEYWORDS) or
+                any(keyword in objective_lower for keyword in _PAIN_KEYWORDS)
             )
 
             if not has_pain_documented:
@@ -723,15 +1091,12 @@ class OllamaSOAPGenerator:
         # Check for "no significant findings" + medications
         if 'no significant findings' in objective_lower:
             # Check if any medications are prescribed (excluding vitamins, preventive meds)
-            medication_section = re.search(r'medications?[:]\s*(.*?)(?=\n\d+\.|\n[A-Z]|$)',
-                                          plan_lower, re.DOTALL)
+            medication_section = _MEDICATION_SECTION_RE.search(plan_lower)
 
             if medication_section:
                 meds_text = medication_section.group(1)
                 # Exclude preventive/maintenance meds
-                exclude_terms = ['vitamin', 'supplement', 'follow-up', 'continue']
-
-                if meds_text and not any(term in meds_text for term in exclude_terms):
+                if meds_text and not any(term in meds_text for term in _MAINTENANCE_MED_TERMS):
                     if len(meds_text.strip()) > 10:  # Has actual medication content
                         warnings.append(
                             "⚠️  CLINICAL LOGIC WARNING: Objective section states 'no significant findings' "
@@ -740,14 +1105,8 @@ class OllamaSOAPGenerator:
 
         # Check for TID/BID/QID + PRN conflicts (contradictory)
         # Pattern: looks for scheduled frequency (TID/BID/QID) followed by PRN/as needed
-        tid_prn_patterns = [
-            r'(tid|bid|qid)\s+(prn|as\s+needed)',  # TID PRN
-            r'(prn|as\s+needed)\s+(tid|bid|qid)',  # PRN TID
-            r'(tid|bid|qid).*\s+(prn|as\s+needed)',  # TID ... PRN (with words between)
-        ]
-
-        for pattern in tid_prn_patterns:
-            match = re.search(pattern, plan_lower, re.IGNORECASE)
+        for pattern in _TID_PRN_RES:
+            match = pattern.search(plan_lower)
             if match:
                 warnings.append(
                     f"⚠️  MEDICATION ERROR: Found contradictory frequency '{match.group()}'. "
@@ -758,31 +1117,25 @@ class OllamaSOAPGenerator:
                 break  # Only warn once
 
         # Check for high-dose benzodiazepines
-        # Clonazepam >2mg/day, Lorazepam >4mg/day, Alprazolam >4mg/day
-        benzo_patterns = [
-            (r'clonazepam\s+(\d+(?:\.\d+)?)\s*mg', 2.0, 'clonazepam'),
-            (r'klonopin\s+(\d+(?:\.\d+)?)\s*mg', 2.0, 'klonopin (clonazepam)'),
-            (r'lorazepam\s+(\d+(?:\.\d+)?)\s*mg', 4.0, 'lorazepam'),
-            (r'ativan\s+(\d+(?:\.\d+)?)\s*mg', 4.0, 'ativan (lorazepam)'),
-            (r'alprazolam\s+(\d+(?:\.\d+)?)\s*mg', 4.0, 'alprazolam'),
-            (r'xanax\s+(\d+(?:\.\d+)?)\s*mg', 4.0, 'xanax (alprazolam)'),
-        ]
-
-        for pattern, max_dose, med_name in benzo_patterns:
-            matches = re.findall(pattern, plan_lower, re.IGNORECASE)
+        # Doses are multiplied by the plan's frequency (TID/QID/BID), which
+        # only depends on the plan, so it is resolved lazily once
+        doses_per_day = None
+        for pattern, max_dose, med_name in _BENZO_RES:
+            matches = pattern.findall(plan_lower)
             if matches:
+                if doses_per_day is None:
+                    if 'tid' in plan_lower:
+                        doses_per_day = 3
+                    elif 'qid' in plan_lower:
+                        doses_per_day = 4
+                    elif 'bid' in plan_lower:
+                        doses_per_day = 2
+                    else:
+                        doses_per_day = 1
                 for dose_str in matches:
                     try:
                         dose = float(dose_str)
-                        # Check if it's TID/QID (multiply by frequency)
-                        if 'tid' in plan_lower:
-                            total_daily = dose * 3
-                        elif 'qid' in plan_lower:
-                            total_daily = dose * 4
-                        elif 'bid' in plan_lower:
-                            total_daily = dose * 2
-                        else:
-                            total_daily = dose
+                        total_daily = dose * doses_per_day
 
                         if total_daily > max_dose:
                             warnings.append(
@@ -797,6 +1150,67 @@ class OllamaSOAPGenerator:
         return warnings
 
 
+class VLLMSOAPGenerator(OllamaSOAPGenerator):
+    """
+    SOAP note generator backed by a vLLM OpenAI-compatible server.
+
+    Drop-in replacement for OllamaSOAPGenerator: prompting, parsing and
+    validation are inherited unchanged, only the LLM handle differs.
+    vLLM batches concurrent requests continuously, so parallel agenerate()
+    calls share forward passes instead of queueing behind each other.
+    """
+
+    def _llm_for_messages(self, messages: list[BaseMessage]) -> BaseLanguageModel:
+        """vLLM's context length is fixed server-side (--max-model-len)."""
+        return self.llm
+
+    def _initialize_llm(self) -> None:
+        """
+        Initialize the ChatOpenAI client pointed at the vLLM server.
+
+        langchain-openai is imported here so Ollama-only deployments
+        don't need it installed.
+        """
+        from langchain_openai import ChatOpenAI
+
+        logger.info(
+            f"Initializing vLLM client: {self.settings.vllm_model} "
+            f"at {self.settings.vllm_base_url}"
+        )
+
+        if not self.settings.skip_connection_test:
+            self._test_connection()
+
+        self._llm = ChatOpenAI(
+            base_url=self.settings.vllm_base_url,
+            # vLLM ignores the key unless started with --api-key
+            api_key="EMPTY",
+            model=self.settings.vllm_model,
+            max_tokens=self.settings.vllm_max_tokens,
+            temperature=self.settings.ollama_temperature,
+            timeout=self.settings.ollama_timeout,
+        )
+
+        self._llm_initialized = True
+        logger.info("vLLM client initialized successfully")
+
+    def _test_connection(self) -> None:
+        """
+        Check that the vLLM server is up via its /health endpoint.
+
+        A plain HTTP GET rather than a test prompt, so startup doesn't
+        spend a prefill + decode round trip on the model.
+        """
+        try:
+            response = httpx.get(self.settings.vllm_health_url, timeout=3.0)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise OllamaConnectionError(
+                url=self.settings.vllm_base_url,
+                original_error=str(e)
+            )
+
+
 class MockSOAPGenerator:
     """
     Mock generator for testing.
@@ -819,11 +1233,19 @@ class MockSOAPGenerator:
         self.call_count += 1
         return self.mock_note
     
-    async def agenerate(self, transcription: str, language: str = "en") -> SOAPNote:
-        """Return mock SOAP note (async)."""
+    async def agenerate(
+        self,
+        transcription: str,
+        language: str = "en",
+        on_section: Optional[SectionCallback] = None
+    ) -> SOAPNote:
+        """Return mock SOAP note (async), reporting its sections if asked."""
         self.call_count += 1
         # Simulate some async delay for realistic testing
         await asyncio.sleep(0.01)
+        if on_section is not None:
+            for section_name in _SOAP_SECTIONS:
+                on_section(section_name, getattr(self.mock_note, section_name))
         return self.mock_note
 
 
@@ -851,5 +1273,10 @@ def create_soap_generator(
         logger.info("Creating mock SOAP generator")
         return MockSOAPGenerator(mock_note=mock_note)
     
+    settings = settings or get_settings()
+    if settings.llm_backend == "vllm":
+        logger.info("Creating vLLM SOAP generator")
+        return VLLMSOAPGenerator(settings=settings)
+    
     logger.info("Creating Ollama SOAP generator")
     return OllamaSOAPGenerator(settings=settings)
@@ -400,7 +400,7 @@ class WhisperTranscriber:
             raise UnsupportedAudioFormatError(
                 file_path=audio_path,
                 format=extension,
-                supported_formats=self.settings.supported_audio_formats
+                supported_formats=self.settings.supported_audio_formats_list
             )
         
         # Check file size (basic sanity check)
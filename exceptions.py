@@ -7,7 +7,7 @@ This module defines a hierarchy of custom exceptions that:
 1. **Categorize Errors**: Different exception types for different problems
 2. **Carry Context**: Include relevant information for debugging
 3. **Enable Recovery**: Allow calling code to handle specific errors
-4. **Support APIs**: Map cleanly to HTTP status codes (future)
+4. **Support APIs**: Map cleanly to HTTP status codes via ``http_status``
 
 Exception Hierarchy:
     MedScribeError (base)
@@ -19,7 +19,8 @@ Exception Hierarchy:
     │   └── WhisperModelError
     ├── GenerationError
     │   └── OllamaConnectionError
-    └── ConfigurationError
+    ├── ConfigurationError
+    └── RateLimitExceededError
 """
 
 from typing import Optional
@@ -40,8 +41,12 @@ class MedScribeError(Exception):
     Attributes:
         message: Human-readable error description
         details: Additional context (dict for API responses)
+        http_status: HTTP status code used by the API error handler.
+            Subclasses inherit their parent's code unless they override it.
     """
     
+    http_status: int = 500
+    
     def __init__(
         self, 
         message: str, 
@@ -77,6 +82,8 @@ class AudioError(MedScribeError):
 class AudioFileNotFoundError(AudioError):
     """Raised when the specified audio file doesn't exist."""
     
+    http_status = 404
+    
     def __init__(self, file_path: str):
         super().__init__(
             message=f"Audio file not found: {file_path}",
@@ -87,6 +94,8 @@ class AudioFileNotFoundError(AudioError):
 class UnsupportedAudioFormatError(AudioError):
     """Raised when the audio file format is not supported."""
     
+    http_status = 400
+    
     def __init__(self, file_path: str, format: str, supported_formats: list[str]):
         super().__init__(
             message=f"Unsupported audio format: {format}. Supported: {', '.join(supported_formats)}",
@@ -101,6 +110,8 @@ class UnsupportedAudioFormatError(AudioError):
 class AudioTooLongError(AudioError):
     """Raised when audio exceeds maximum allowed duration."""
     
+    http_status = 413
+    
     def __init__(
         self, 
         file_path: str, 
@@ -164,6 +175,8 @@ class GenerationError(MedScribeError):
 class OllamaConnectionError(GenerationError):
     """Raised when we can't connect to Ollama."""
     
+    http_status = 503
+    
     def __init__(self, url: str, original_error: str):
         super().__init__(
             message=f"Cannot connect to Ollama at {url}: {original_error}",
@@ -217,3 +230,23 @@ class ConfigurationError(MedScribeError):
                 "issue": issue
             }
         )
+
+
+# =============================================================================
+# API Errors
+# =============================================================================
+
+class RateLimitExceededError(MedScribeError):
+    """Raised when a client exceeds its request limit for a route."""
+    
+    http_status = 429
+    
+    def __init__(self, limit: int, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(
+            message=f"Rate limit exceeded: {limit} per 1 minute",
+            details={
+                "limit": limit,
+                "retry_after": retry_after
+            }
+        )
@@ -185,10 +185,23 @@ def generate_soap_task(job_id: str, transcription: str, language: str = "en"):
 
         pipeline = create_pipeline()
 
+        # Publish each SOAP section as soon as it has streamed in, so
+        # WebSocket clients can show it before the whole note is done
+        partial_result = {}
+
+        def publish_section(section: str, content: str) -> None:
+            partial_result[section] = content
+            job_manager.update_job(job_id, {
+                "progress": 10 + 20 * len(partial_result),
+                "current_stage": f"generated_{section}",
+                "partial_result": dict(partial_result)
+            })
+
         result = asyncio.run(
             pipeline.agenerate_soap_only(
                 transcription=transcription,
-                language=language
+                language=language,
+                on_section=publish_section
             )
         )
 